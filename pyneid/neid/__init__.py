@@ -20,7 +20,7 @@ class Conf (_config.ConfigNamespace):
 
 conf = Conf()
 
-from .core import Neid, Archive, NeidTap, TapJob, objLookup
+from .core import Neid, Archive, NeidTap, TapJob, objLookup, NeidQueryError
 
-__all__ = ['Neid', 'Archive', 'NeidTap', 'TapJob', 
+__all__ = ['Neid', 'Archive', 'NeidTap', 'TapJob', 'NeidQueryError',
            'Conf', 'conf'] 
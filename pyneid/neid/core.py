@@ -1,23 +1,328 @@
 import os
-import sys
 import io
 import getpass
+import shutil
 import logging
+import logging.handlers
+import queue
+import atexit
 import json
+import functools
+import asyncio
 
 import time
 import xmltodict
+import numpy
 import tempfile
-import bs4 as bs
 
 import requests
-import urllib
+import urllib.parse
 import http.cookiejar
 
+from lxml import etree
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from concurrent.futures import ThreadPoolExecutor
+
 from astropy.table import Table, Column
+from astropy.io import votable
 
 from . import conf
 
+"""orjson, when installed, parses the returned json structures directly 
+from the response bytes and faster than the json module
+"""
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+_log = logging.getLogger (__name__)
+
+"""block size of the loops reading a TAP result: larger than the socket
+receive buffer, so one Python iteration moves a full read
+"""
+
+_DOWNLOAD_CHUNK = 1 << 16
+
+"""namespaces of the UWS job status document; the uws prefix declared by
+the document itself takes precedence
+"""
+
+_UWS_NS = 'http://www.ivoa.net/xml/UWS/v1.0'
+_XLINK_NS = 'http://www.w3.org/1999/xlink'
+
+
+"""astropy format names of the ascii result formats of the TAP service
+"""
+
+_ASCII_FORMATS = {
+    'ipac': 'ascii.ipac',
+    'csv': 'ascii.csv',
+    'tsv': 'ascii.tab'
+}
+
+
+class NeidQueryError (RuntimeError):
+
+    """raised by the Archive methods when a query or a download cannot 
+    proceed, e.g. the TAP service returned an error or the metadata table 
+    could not be read
+    """
+
+    pass
+
+
+_debugfname = ''
+
+
+@functools.lru_cache (maxsize=8)
+def _read_cookiejar (cookiepath, mtime_ns):
+
+    cookiejar = http.cookiejar.MozillaCookieJar (cookiepath)
+    cookiejar.load (ignore_discard=True, ignore_expires=True)
+
+    return (cookiejar)
+
+
+def _load_cookiejar (cookiepath):
+
+    """load the cookie file saved by login; the loaded jar is cached per 
+    path and modification time and shared by the NeidTap objects and 
+    downloads using it, so it must not be modified.  A cookie file 
+    rewritten since it was loaded is read again; Archive.login also 
+    clears the cache.
+    """
+
+    return (_read_cookiejar (cookiepath, os.stat (cookiepath).st_mtime_ns))
+
+
+def _content_type (response):
+
+    """the media type of a response in lower case, without parameters such
+    as '; charset=utf-8'; an empty string when the header is missing
+    """
+
+    content_type = response.headers.get ('Content-type', '')
+
+    return (content_type.split (';', 1)[0].strip().lower())
+
+
+def _redact (secret):
+
+    """stand-in for a password, token or cookie value in debug records: 
+    they reach every handler of the root logger, not only the debug file
+    """
+
+    if (secret is None) or (len(secret) == 0):
+        return ('')
+
+    return ('<redacted>')
+
+
+def _fmt_jar (cookiejar):
+
+    """format a cookiejar for the debug file, one name=<redacted>@domain 
+    per line
+    """
+
+    return '\n'.join (f'{cookie.name}={_redact (cookie.value)}' \
+        f'@{cookie.domain}' for cookie in cookiejar)
+
+
+"""suffix of the sidecar file kept next to a download in progress: it 
+holds the server's Last-Modified of the file, the If-Range validator of 
+a later resume
+"""
+
+_LASTMOD_SUFFIX = '.lastmod'
+
+
+def _read_lastmod (filepath):
+
+    """the Last-Modified recorded for a partial download, '' when none was
+    """
+
+    try:
+        with open (filepath + _LASTMOD_SUFFIX, 'r') as fp:
+            return (fp.read().strip())
+    except OSError:
+        return ('')
+
+
+def _write_lastmod (filepath, lastmod):
+
+    """record the Last-Modified of a download, or drop the record when 
+    lastmod is ''
+    """
+
+    try:
+        if (len(lastmod) > 0):
+            with open (filepath + _LASTMOD_SUFFIX, 'w') as fp:
+                fp.write (lastmod)
+        else:
+            os.remove (filepath + _LASTMOD_SUFFIX)
+    except OSError:
+        pass
+
+    return
+
+
+def _write_stream (raw, filepath, append=0, blocksize=2*1024*1024):
+
+    """copy a raw http stream to filepath with unbuffered os.write calls 
+    of up to blocksize bytes; the kernel is told the file is written 
+    sequentially where posix_fadvise exists (not on Windows or macOS)
+    """
+
+    flags = os.O_WRONLY | os.O_CREAT | getattr (os, 'O_BINARY', 0)
+    if (append):
+        flags |= os.O_APPEND
+    else:
+        flags |= os.O_TRUNC
+
+    fd = os.open (filepath, flags, 0o644)
+    try:
+        if (hasattr (os, 'posix_fadvise')):
+            os.posix_fadvise (fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+        """read and write are bound once, outside the copy loop
+        """
+
+        read = raw.read
+        write = os.write
+
+        while True:
+            buf = read (blocksize)
+            if (not buf):
+                break
+
+            view = memoryview (buf)
+            while (len(view) > 0):
+                view = view[write (fd, view):]
+    finally:
+        os.close (fd)
+
+
+class _BufferedFileHandler (logging.FileHandler):
+
+    """FileHandler writing through a 64 KiB buffer: unlike StreamHandler 
+    it does not flush after every record, the buffer is flushed when full 
+    and when the handler is flushed or closed.
+    """
+
+    def _open (self):
+        return open (self.baseFilename, self.mode, buffering=1<<16, \
+            encoding=self.encoding)
+
+    def emit (self, record):
+
+        if (self.stream is None):
+            self.stream = self._open()
+
+        try:
+            msg = self.format (record)
+            self.stream.write (msg + self.terminator)
+        except Exception:
+            self.handleError (record)
+
+        return
+
+
+def _init_debuglog (debugfname):
+
+    """send debug messages to debugfname, truncated when opened; only the
+    first call configures logging, repeated calls (from any Archive 
+    method receiving 'debugfile') are ignored.
+
+    The module logger gets a QueueHandler, formatted as basicConfig does,
+    so the application's own logging setup is left untouched.  The 
+    records are written to the file by a QueueListener thread so the 
+    download loop never waits on the debug file, and that thread writes 
+    through a buffered handler.
+    At interpreter exit the listener is stopped, draining the queue, and 
+    then the buffer is flushed.
+    """
+
+    global _debugfname
+
+    if (len(_debugfname) > 0):
+        return
+
+    _debugfname = debugfname
+
+    logqueue = queue.Queue (-1)
+
+    fhandler = _BufferedFileHandler (debugfname, mode='w', delay=True)
+    listener = logging.handlers.QueueListener (logqueue, fhandler, \
+        respect_handler_level=True)
+
+    qhandler = logging.handlers.QueueHandler (logqueue)
+    qhandler.setFormatter (logging.Formatter (logging.BASIC_FORMAT))
+
+    _log.addHandler (qhandler)
+    _log.setLevel (logging.DEBUG)
+
+    listener.start()
+
+    """atexit runs the last registered function first
+    """
+
+    atexit.register (fhandler.flush)
+    atexit.register (listener.stop)
+
+    return
+
+
+def _make_session ():
+
+    """make a requests session whose connection pool is shared by all 
+    requests to the NEID server, so consecutive (and concurrent) downloads 
+    reuse the open TLS connections; transient gateway errors are retried.
+    """
+
+    retry = Retry (total=3, backoff_factor=0.3, \
+        status_forcelist=[502, 503, 504])
+
+    adapter = HTTPAdapter (pool_connections=16, pool_maxsize=16, \
+        max_retries=retry)
+
+    session = requests.Session()
+    session.mount ('https://', adapter)
+    session.mount ('http://', adapter)
+
+    """the session is shared by every Archive, NeidTap and TapJob whatever
+    their credentials: it must not keep the cookies set by the server and
+    send them with later requests.  Credentials go with each request as 
+    its own cookies= or token parameter.
+    """
+
+    session.cookies.set_policy (http.cookiejar.DefaultCookiePolicy \
+        (allowed_domains=[]))
+
+    return (session)
+
+
+_session = None
+
+
+def _get_session ():
+
+    """the module-wide http session, created on first use: Archive and the
+    NeidTap, TapJob and objLookup objects built without a session keyword 
+    all reuse its kept-alive connections
+    """
+
+    global _session
+
+    if (_session is None):
+        _session = _make_session()
+
+    return (_session)
+
 
 class Archive:
     """ 
@@ -65,58 +370,108 @@ class Archive:
     debugfname = './archive.debug'    
     debug = 0    
 
+    _session = None
+
     def __init__(self, **kwargs):
         
-        if ('debugfile' in kwargs):
-            
-            self.debug = 1
-            self.debugfname = kwargs.get ('debugfile')
+        self.__set_debug (kwargs)
+ 
+        _log.debug ('')
+        _log.debug ('Enter Archive.init:')
 
-            if (len(self.debugfname) > 0):
+        self._tap_cache = dict()
+
+        self.baseurl = None
+        self.__set_urls (kwargs)
       
-                logging.basicConfig (filename=self.debugfname, \
-                    level=logging.DEBUG)
+        return
     
-                with open (self.debugfname, 'w') as fdebug:
-                    pass
- 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter Archive.init:')
+    def __set_urls (self, kwargs):
 
-        """retrieve baseurl from conf class;
-        during dev or test, baseurl will be a keyword input
+        """retrieve baseurl from conf class; during dev or test, baseurl 
+        will be a keyword input.  The service urls are only rebuilt when 
+        the baseurl differs from the one they were built from.
         """
 
-        self.baseurl = conf.server
+        baseurl = conf.server
 
-        self.baseurl = ''
-        
         if ('server' in kwargs):
-            self.baseurl = kwargs.get ('server')
+            baseurl = kwargs.get ('server')
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'baseurl= {self.baseurl:s}')
+        if (baseurl == self.baseurl):
+            return
+
+        self.baseurl = baseurl
 
-        """urls for nph-tap.py, nph-neidLogin, nph-neidMakeQyery, 
-            nph-neidDownload
+        _log.debug ('')
+        _log.debug ('baseurl= %s', self.baseurl)
+
+        """urls for nph-tap.py, nph-neidLogin, nph-neidMakeQyery; 
+        the files are downloaded from get_file.php on the NEID server
         """
 
-        self.tap_url = self.baseurl + '/TAP'
+        self.tap_url = self.baseurl + 'TAP'
         self.login_url = self.baseurl + 'cgi-bin/NeidAPI/nph-neidLogin.py?'
         self.makequery_url = self.baseurl + 'cgi-bin/NeidAPI/nph-neidMakequery.py?'
-        self.getneid_url = self.baseurl + 'cgi-bin/NeidAPI/nph-neidDownload.py?'
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'login_url= [{self.login_url:s}]')
-            logging.debug (f'tap_url= [{self.tap_url:s}]')
-            logging.debug (f'makequery_url= [{self.makequery_url:s}]')
-            logging.debug (f'self.getneid_url= {self.getneid_url:s}')
+        #self.getneid_url = self.baseurl + 'cgi-bin/NeidAPI/nph-neidDownload.py?'
+        getfile_baseurl = 'https://neid.ipac.caltech.edu/'
+
+        self.getneid_url = getfile_baseurl + 'get_file.php?'
+        #self.getneid_url = getfile_baseurl + 'get_file_pyNEID.php?'
+
+        _log.debug ('')
+        _log.debug ('login_url= [%s]', self.login_url)
+        _log.debug ('tap_url= [%s]', self.tap_url)
+        _log.debug ('makequery_url= [%s]', self.makequery_url)
+        _log.debug ('self.getneid_url= %s', self.getneid_url)
       
         return
     
+    def __get_session (self):
+
+        """create the http session on first use; it is kept for the life 
+        of the Archive object
+        """
+
+        if (self._session is None):
+            self._session = _get_session()
+
+        return (self._session)
+
+    def set_session (self, session):
+
+        """use the given requests session (e.g. one with its own adapter or
+        pool size) for all subsequent queries and downloads; NeidTap objects
+        cached with the previous session are dropped.
+        """
+
+        self._session = session
+        self._tap_cache.clear()
+
+        return
+
+    def __set_debug (self, kwargs):
+
+        """turn on debug the first time a 'debugfile' keyword is given;
+        the debug file itself is configured once per python session by
+        _init_debuglog.
+        """
+
+        if (self.debug) or ('debugfile' not in kwargs):
+            return
+
+        self.debug = 1
+        self.debugfname = kwargs.get ('debugfile')
+
+        if (len(self.debugfname) > 0):
+            _init_debuglog (self.debugfname)
+
+        _log.debug ('')
+        _log.debug ('debug turned on')
+
+        return
+
     def login (self, **kwargs):
         """
         login method validates a user has a valid NEID account; it takes two 
@@ -153,30 +508,11 @@ class Archive:
         be used for other Neid methods in the same python session.
         """
 
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
-
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
-
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
+        self.__set_debug (kwargs)
  
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter login:')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter login:')
 
 
         userid= ''
@@ -187,10 +523,11 @@ class Archive:
         if ('password' in kwargs):
             password = kwargs.get ('password')
         
+        _log.debug ('')
+        _log.debug ('userid= [%s]', userid)
+
         if self.debug:
-            logging.debug ('')
-            logging.debug (f'userid= [{userid:s}]')
-            logging.debug (f'password= [{password:s}]')
+            _log.debug ('password= [%s]', _redact (password))
 
         url = ''
         response = ''
@@ -216,41 +553,22 @@ class Archive:
             logging.debug (f'password= {password:s}')
         """
 
-        """retrieve baseurl from conf class;
-        """ 
-        
-        self.baseurl = conf.server
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'baseurl (from conf)= {self.baseurl:s}')
-        
-
         """retrieve cookiepath
         """
         
         if ('cookiepath' in kwargs):
             self.cookiepath = kwargs.get ('cookiepath')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'cookiepath= {self.cookiepath:s}')
+        _log.debug ('')
+        _log.debug ('cookiepath= %s', self.cookiepath)
 
-        """construct full url for login
+        """full url for login
         """
 
-        if ('server' in kwargs):
-            self.baseurl = kwargs.get ('server')
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'baseurl= {self.baseurl:s}')
-
-        self.login_url = self.baseurl + 'cgi-bin/NeidAPI/nph-neidLogin.py?'
+        self.__set_urls (kwargs)
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'login_url= [{self.login_url:s}]')
+        _log.debug ('')
+        _log.debug ('login_url= [%s]', self.login_url)
 
         param = dict()
         param['userid'] = userid
@@ -261,16 +579,16 @@ class Archive:
         url = self.login_url + data_encoded
 
         if self.debug:
-            logging.debug ('')
-            logging.debug (f'url= [{url:s}]')
+            _log.debug ('')
+            _log.debug ('url= [%s]', self.login_url + urllib.parse.urlencode \
+                ({'userid': userid, 'password': _redact (password)}))
 
 
         """cookiejar declared and linked to cookiepath
         """
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('declare request session with cookie')
+        _log.debug ('')
+        _log.debug ('declare request session with cookie')
         
         session = requests.Session()
         session.cookies = http.cookiejar.MozillaCookieJar (self.cookiepath)
@@ -286,25 +604,32 @@ class Archive:
             print (self.msg)
             return
 
+        """the body is read once, as bytes: it is logged and parsed from 
+        the same buffer without decoding it to str
+        """
+
+        body = response.content
+
+        """the body and headers carry the token and the session cookie
+        """
+
         if self.debug:
-            logging.debug ('')
-            logging.debug ('response.text: ')
-            logging.debug (response.text)
-            logging.debug ('response.headers: ')
-            logging.debug (response.headers)
+            _log.debug ('')
+            _log.debug ('response.content: %s', body)
+            _log.debug ('response.headers: ')
+            _log.debug (response.headers)
        
         """check content-type in response header: 
         it should be an 'application/json' structure, parse for returned 
         status and message
         """
 
-        contenttype = response.headers['Content-type']
+        contenttype = _content_type (response)
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'contenttype= {contenttype:s}')
+        _log.debug ('')
+        _log.debug ('contenttype= %s', contenttype)
 
-        jsondata = json.loads (response.text);
+        jsondata = _loads (body);
    
         for key,val in jsondata.items():
                 
@@ -318,16 +643,21 @@ class Archive:
                 self.token =  val
        
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'status= {self.status:s}')
-            logging.debug (f'msg= {self.msg:s}')
-            logging.debug (f'token= {self.token:s}')
-            logging.debug (f'cookiepath= {self.cookiepath:s}')
+        _log.debug ('')
+        _log.debug ('status= %s', self.status)
+        _log.debug ('msg= %s', self.msg)
+        _log.debug ('token= %s', _redact (self.token))
+        _log.debug ('cookiepath= %s', self.cookiepath)
 
 
         if (self.status == 'ok'):
             
+            """NeidTap objects and cookie jars loaded before this login 
+            carry the old credentials
+            """
+
+            self._tap_cache.clear()
+            _read_cookiejar.cache_clear()
             
             self.msg = 'Successfully login as ' + userid
 
@@ -340,13 +670,8 @@ class Archive:
                 """
 
                 if self.debug:
-                    for cookie in cookiejar:
-                        logging.debug ('')
-                        logging.debug ('cookie saved:')
-                        logging.debug (cookie)
-                        logging.debug (f'cookie.name= {cookie.name:s}')
-                        logging.debug (f'cookie.value= {cookie.value:s}')
-                        logging.debug (f'cookie.domain= {cookie.domain:s}')
+                    _log.debug ('')
+                    _log.debug ('cookies saved:\n%s', _fmt_jar (cookiejar))
  
         else:       
             self.msg = 'Failed to login: ' + self.msg
@@ -405,29 +730,11 @@ class Archive:
             >>>                      outpath=outpath) 
         """
  
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
+        self.__set_debug (kwargs)
 
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
-
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter query_datetime:')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter query_datetime:')
        
         datalevel = str(datalevel)
 
@@ -444,10 +751,9 @@ class Archive:
         self.datalevel = datalevel
         self.datetime = datetime
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'datalevel= {self.datalevel:s}')
-            logging.debug (f'datetime= {self.datetime:s}')
+        _log.debug ('')
+        _log.debug ('datalevel= %s', self.datalevel)
+        _log.debug ('datetime= %s', self.datetime)
 
         """send url to server to construct the select statement
         """
@@ -456,9 +762,8 @@ class Archive:
         param['datalevel'] = self.datalevel
         param['datetime'] = self.datetime
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('call query_criteria')
+        _log.debug ('')
+        _log.debug ('call query_criteria')
 
         self.query_criteria (param, **kwargs)
 
@@ -504,29 +809,11 @@ class Archive:
 
         """
    
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
-
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
+        self.__set_debug (kwargs)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter query_position:')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter query_position:')
       
         
         datalevel = str(datalevel)
@@ -543,10 +830,9 @@ class Archive:
         self.datalevel = datalevel
         self.position = position
  
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'datalevel=  {self.datalevel:s}')
-            logging.debug (f'position=  {self.position:s}')
+        _log.debug ('')
+        _log.debug ('datalevel=  %s', self.datalevel)
+        _log.debug ('position=  %s', self.position)
 
         """send url to server to construct the select statement
         """
@@ -593,29 +879,11 @@ class Archive:
             >>>       outpath=outpath)
         """
    
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
+        self.__set_debug (kwargs)
 
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
-
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter query_object_name:')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter query_object_name:')
 
         datalevel = str(datalevel)
 
@@ -630,36 +898,33 @@ class Archive:
         self.datalevel = datalevel
         self.object = object
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'datalevel= {self.datalevel:s}')
-            logging.debug (f'object= {self.object:s}')
+        _log.debug ('')
+        _log.debug ('datalevel= %s', self.datalevel)
+        _log.debug ('object= %s', self.object)
 
         radius = 0.5 
         if ('radius' in kwargs):
             radiusi_str = kwargs.get('radius')
             radius = float(radius_str)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'radius= {radius:f}')
+        _log.debug ('')
+        _log.debug ('radius= %f', radius)
 
         lookup = None
         try:
             if self.debug:
-                lookup = objLookup (object, debug=1)
+                lookup = objLookup (object, debug=1, \
+                    session=self.__get_session())
             else:
-                lookup = objLookup (object)
+                lookup = objLookup (object, session=self.__get_session())
         
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('objLookup run successful and returned')
+            _log.debug ('')
+            _log.debug ('objLookup run successful and returned')
         
         except Exception as e:
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'objLookup error: {str(e):s}')
+            _log.debug ('')
+            _log.debug ('objLookup error: %s', e)
             
             print (str(e))
             return 
@@ -672,17 +937,16 @@ class Archive:
             print (self.msg)
             return
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'source= {lookup.source:s}')
-            logging.debug (f'objname= {lookup.objname:s}')
-            logging.debug (f'objtype= {lookup.objtype:s}')
-            logging.debug (f'objdesc= {lookup.objdesc:s}')
-            logging.debug (f'parsename= {lookup.parsename:s}')
-            logging.debug (f'ra2000= {lookup.ra2000:s}')
-            logging.debug (f'dec2000= {lookup.dec2000:s}')
-            logging.debug (f'cra2000= {lookup.cra2000:s}')
-            logging.debug (f'cdec2000= {lookup.cdec2000:s}')
+        _log.debug ('')
+        _log.debug ('source= %s', lookup.source)
+        _log.debug ('objname= %s', lookup.objname)
+        _log.debug ('objtype= %s', lookup.objtype)
+        _log.debug ('objdesc= %s', lookup.objdesc)
+        _log.debug ('parsename= %s', lookup.parsename)
+        _log.debug ('ra2000= %s', lookup.ra2000)
+        _log.debug ('dec2000= %s', lookup.dec2000)
+        _log.debug ('cra2000= %s', lookup.cra2000)
+        _log.debug ('cdec2000= %s', lookup.cdec2000)
 
        
         ra2000 = lookup.ra2000
@@ -690,9 +954,8 @@ class Archive:
 
         self.position = 'circle ' + ra2000 + ' ' + dec2000 + ' ' + str(radius)
 	
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'position= {self.position:s}')
+        _log.debug ('')
+        _log.debug ('position= %s', self.position)
        
         print (f'object name resolved: ra2000= {ra2000:s}, de2000c={dec2000:s}')
  
@@ -737,29 +1000,11 @@ class Archive:
 
         """
    
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
-
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
+        self.__set_debug (kwargs)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter query_object_name:')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter query_object_name:')
 
         datalevel = str(datalevel)
 
@@ -774,19 +1019,17 @@ class Archive:
         self.datalevel = datalevel
         self.qobject = qobject
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'datalevel= {self.datalevel:s}')
-            logging.debug (f'qobject= {self.qobject:s}')
+        _log.debug ('')
+        _log.debug ('datalevel= %s', self.datalevel)
+        _log.debug ('qobject= %s', self.qobject)
 
         radius = 0.5 
         if ('radius' in kwargs):
             radiusi_str = kwargs.get('radius')
             radius = float(radius_str)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'radius= {radius:f}')
+        _log.debug ('')
+        _log.debug ('radius= %f', radius)
 
  
         """send url to server to construct the select statement
@@ -825,29 +1068,11 @@ class Archive:
 	    default: -1 or not specified will return all requested records
         """
    
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
-
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
+        self.__set_debug (kwargs)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter query_piname:')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter query_piname:')
 
         datalevel = str(datalevel)
 
@@ -862,10 +1087,9 @@ class Archive:
         self.datalevel = datalevel
         self.piname = piname 
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'datalevel= {self.datalevel:s}')
-            logging.debug (f'piname= {self.piname:s}')
+        _log.debug ('')
+        _log.debug ('datalevel= %s', self.datalevel)
+        _log.debug ('piname= %s', self.piname)
 
         
         """send url to server to construct the select statement
@@ -909,29 +1133,11 @@ class Archive:
             >>>                      outpath=outpath)
         """
    
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
-
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
+        self.__set_debug (kwargs)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter query_program:')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter query_program:')
 
         datalevel = str(datalevel)
 
@@ -946,10 +1152,9 @@ class Archive:
         self.datalevel = datalevel
         self.program = program 
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'datalevel= {self.datalevel:s}')
-            logging.debug (f'program= {self.program:s}')
+        _log.debug ('')
+        _log.debug ('datalevel= %s', self.datalevel)
+        _log.debug ('program= %s', self.program)
 
         
         """send url to server to construct the select statement
@@ -999,29 +1204,11 @@ class Archive:
             >>>     outpath='./criteria.tbl')
         """
 
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
-
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
+        self.__set_debug (kwargs)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter query_criteria')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter query_criteria')
         
         
         """retrieve keyword parameters
@@ -1030,32 +1217,29 @@ class Archive:
         if ('outpath' in kwargs): 
             self.outpath = kwargs.get('outpath')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'outpath= {self.outpath:s}')
+        _log.debug ('')
+        _log.debug ('outpath= %s', self.outpath)
         
         if ('cookiepath' in kwargs): 
             self.cookiepath = kwargs.get('cookiepath')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'cookiepath= {self.cookiepath:s}')
+        _log.debug ('')
+        _log.debug ('cookiepath= %s', self.cookiepath)
 
         if ('token' in kwargs): 
             self.token = kwargs.get('token')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'token= {self.token:s}')
+        _log.debug ('')
+        _log.debug ('token= %s', _redact (self.token))
 
         len_param = len(param)
 
         if self.debug:
-            logging.debug ('')
-            logging.debug (f'len_param= {len_param:d}')
+            _log.debug ('')
+            _log.debug ('len_param= %d', len_param)
 
             for k,v in param.items():
-                logging.debug (f'k, v= {k:s}, {str(v):s}')
+                _log.debug ('k, v= %s, %s', k, v)
 
         """send url to server to construct the select statement
         """
@@ -1069,72 +1253,49 @@ class Archive:
             self.maxrec = kwargs.get('maxrec')
         
         try:
-            self.maxrec = float(self.maxrec)
-            self.maxrec = int(self.maxrec)
-        except Exception as e:
-            print (f'Failed to convert maxrec: ' + str(self.maxrec) + \
-                ' to integer.')
-            return
+            if (not isinstance (self.maxrec, int)):
+                self.maxrec = int (float (self.maxrec))
+        except Exception:
+            raise NeidQueryError ( \
+                f'Failed to convert maxrec: {self.maxrec} to integer.')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'format= {self.format:s}')
-            logging.debug (f'maxrec= {self.maxrec:d}')
+        _log.debug ('')
+        _log.debug ('format= %s', self.format)
+        _log.debug ('maxrec= %d', self.maxrec)
 
         data = urllib.parse.urlencode (param)
 
-        """retrieve baseurl from conf class;
-
-        during dev or test, baseurl will be a keyword input
-        """
-       
-        self.baseurl = conf.server
-
-        if ('server' in kwargs):
-            self.baseurl = kwargs.get ('server')
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'baseurl= {self.baseurl:s}')
-
-        """urls for nph-tap.py, nph-neidLogin, nph-neidMakeQyery, 
-        nph-neidDownload
+        """urls for nph-tap.py and nph-neidMakeQyery
         """
 
-        self.tap_url = self.baseurl + 'TAP'
-        self.makequery_url = self.baseurl + 'cgi-bin/NeidAPI/nph-neidMakequery.py?'
+        self.__set_urls (kwargs)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'tap_url= [{self.tap_url:s}]')
-            logging.debug (f'makequery_url= [{self.makequery_url:s}]')
+        _log.debug ('')
+        _log.debug ('tap_url= [%s]', self.tap_url)
+        _log.debug ('makequery_url= [%s]', self.makequery_url)
 
         url = self.makequery_url + data            
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'url= {url:s}')
+        _log.debug ('')
+        _log.debug ('url= %s', url)
 
         query = ''
         try:
             query = self.__make_query (url) 
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('returned __make_query')
+            _log.debug ('')
+            _log.debug ('returned __make_query')
   
         except Exception as e:
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'Error: {str(e):s}')
+            _log.debug ('')
+            _log.debug ('Error: %s', e)
             
             print (str(e))
             return 
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'query= {query:s}')
+        _log.debug ('')
+        _log.debug ('query= %s', query)
        
         self.query = query
 
@@ -1142,158 +1303,36 @@ class Archive:
         """send tap query
         """
 
-        self.tap = None
-        if (len(self.cookiepath) > 0):
-            
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('xxx0')
-                logging.debug (f'cookiepath= {self.cookiepath:s}')
-       
-            if self.debug:
-                
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-                        cookiefile=self.cookiepath, \
-	                debug=1)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
+        self.tap = self.__get_tap()
 
-            else:
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-                        cookiefile=self.cookiepath)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
-        
-        elif (len(self.token) > 0):
-            
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('xxx1')
-                logging.debug (f'token= {self.token:s}')
-       
-            if self.debug:
-                
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-                        token=self.token, \
-	                debug=1)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
+        if (self.tap is None):
+            return
 
-            else:
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-                        token=self.token)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
-        
-        else: 
-            if self.debug:
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-	                debug=1)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
-        
-            else:
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec)
-        
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
-        
-        if self.debug:
-            logging.debug('')
-            logging.debug('NeidTap initialized')
-            logging.debug('')
-            logging.debug(f'query= {query:s}')
+        _log.debug ('')
+        _log.debug ('NeidTap initialized')
+        _log.debug ('')
+        _log.debug ('query= %s', query)
 
         print ('submitting request...')
 
-        if self.debug:
-            logging.debug('')
-            logging.debug('call self.tap.send_async with debug')
+        _log.debug ('')
+        _log.debug ('call self.tap.send_async')
             
-            retstr = self.tap.send_async (query, \
-                outpath=self.outpath, \
-                format=self.format, \
-                maxrec=self.maxrec, debug=1)
-        else:
-            logging.debug('')
-            logging.debug('call self.tap.send_async NO debug')
-            
-            retstr = self.tap.send_async (query, \
-                outpath=self.outpath, \
-                format=self.format, \
-                maxrec=self.maxrec)
+        retstr = self.tap.send_async (query, \
+            outpath=self.outpath, \
+            format=self.format, \
+            maxrec=self.maxrec, \
+            debug=(1 if self.debug else 0))
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'return self.tap.send_async:')
-            logging.debug (f'retstr= {retstr:s}')
+        _log.debug ('')
+        _log.debug ('return self.tap.send_async:')
+        _log.debug ('retstr= %s', retstr)
 
-        retstr_lower = retstr.lower()
+        """send_async sets the tap status to 'error' on every failure
+        """
 
-        indx = retstr_lower.find ('error')
-    
-        if (indx >= 0):
-            print (retstr)
-            sys.exit()
+        if (self.tap.status == 'error'):
+            raise NeidQueryError (retstr)
 
         """no error: 
         """
@@ -1324,6 +1363,11 @@ class Archive:
         maxrec (integer): (optional) maximum records to be returned 
 	    default: -1 or not specified will return all requested records
 
+        columns (list): (optional) field IDs (names for fields without an
+            ID) or indices of the columns to keep when a votable result is
+            kept in memory (no outpath); the others are skipped while the 
+            result is parsed
+
 
         Example:
 
@@ -1334,29 +1378,11 @@ class Archive:
             >>>     outpath='./adql..tbl')
         """
    
-        if (self.debug == 0):
-
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
-
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
+        self.__set_debug (kwargs)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter query_adql:')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter query_adql:')
         
         if (len(query) == 0):
             print ('Failed to find required parameter: query')
@@ -1364,17 +1390,15 @@ class Archive:
         
         self.query = query
  
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug (f'query= {self.query:s}')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('query= %s', self.query)
        
         if ('cookiepath' in kwargs): 
             self.cookiepath = kwargs.get('cookiepath')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'cookiepath= {self.cookiepath:s}')
+        _log.debug ('')
+        _log.debug ('cookiepath= %s', self.cookiepath)
 
         self.outpath = ''
         if ('outpath' in kwargs): 
@@ -1388,194 +1412,56 @@ class Archive:
         if ('maxrec' in kwargs): 
             self.maxrec = kwargs.get('maxrec')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'outpath= {self.outpath:s}')
-            logging.debug (f'format= {self.format:s}')
-            logging.debug (f'maxrec= {self.maxrec:d}')
-
-        """retrieve baseurl from conf class;
-        """
-        
-        self.baseurl = conf.server
-
-        if ('server' in kwargs):
-            self.baseurl = kwargs.get ('server')
+        columns = kwargs.get ('columns')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'baseurl= {self.baseurl:s}')
+        _log.debug ('')
+        _log.debug ('outpath= %s', self.outpath)
+        _log.debug ('format= %s', self.format)
+        _log.debug ('maxrec= %s', self.maxrec)
+        _log.debug ('columns= %s', columns)
 
         """urls for nph-tap.py
         """
 
-        self.tap_url = self.baseurl + 'TAP'
+        self.__set_urls (kwargs)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'tap_url= [{self.tap_url:s}]')
+        _log.debug ('')
+        _log.debug ('tap_url= [%s]', self.tap_url)
 
         """send tap query
         """
 
-        self.tap = None
-        if (len(self.cookiepath) > 0):
-            
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('xxx0')
-                logging.debug (f'cookiepath= {self.cookiepath:s}')
-       
-            if self.debug:
-                
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-                        cookiefile=self.cookiepath, \
-	                debug=1)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
+        self.tap = self.__get_tap()
 
-            else:
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-                        cookiefile=self.cookiepath)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
-        
-        elif (len(self.token) > 0):
-            
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('xxx1')
-                logging.debug (f'token= {self.token:s}')
-       
-            if self.debug:
-                
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-                        token=self.token, \
-	                debug=1)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
+        if (self.tap is None):
+            return
 
-            else:
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-                        token=self.token)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
-        
-        else: 
-            if self.debug:
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec, \
-	                debug=1)
-                
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
-        
-            else:
-                try:
-                    self.tap = NeidTap (self.tap_url, \
-                        format=self.format, \
-                        maxrec=self.maxrec)
-        
-                except Exception as e:
-            
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'Error: {str(e):s}')
-                    
-                    print (str(e))
-                    return 
-        
-        if self.debug:
-            logging.debug('')
-            logging.debug('NeidTap initialized')
-            logging.debug(f'query= {query:s}')
-            logging.debug('call self.tap.send_async')
+        _log.debug ('')
+        _log.debug ('NeidTap initialized')
+        _log.debug ('query= %s', query)
+        _log.debug ('call self.tap.send_async')
 
         print ('submitting request...')
 
-        if self.debug:
-            if (len(self.outpath) > 0):
-                retstr = self.tap.send_async (query, \
-                    outpath=self.outpath, \
-                    format=self.format, \
-                    maxrec=self.maxrec, \
-                    debug=1)
-            else:
-                retstr = self.tap.send_async (query, \
-                    format=self.format, \
-                    maxrec=self.maxrec, \
-                    debug=1)
-        else:
-            if (len(self.outpath) > 0):
-                retstr = self.tap.send_async (query, \
-                    outpath=self.outpath, \
-                    format=self.format, \
-                    maxrec=self.maxrec)
-            else:
-                retstr = self.tap.send_async (query, \
-                    format=self.format, \
-                    maxrec=self.maxrec)
+        """an empty outpath keeps the result in memory (astropy table)
+        """
+
+        retstr = self.tap.send_async (query, \
+            outpath=self.outpath, \
+            format=self.format, \
+            maxrec=self.maxrec, \
+            columns=columns, \
+            debug=(1 if self.debug else 0))
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'return self.tap.send_async:')
-            logging.debug (f'retstr= {retstr:s}')
+        _log.debug ('')
+        _log.debug ('return self.tap.send_async:')
+        _log.debug ('retstr= %s', retstr)
 
-        retstr_lower = retstr.lower()
+        """send_async sets the tap status to 'error' on every failure
+        """
 
-        indx = retstr_lower.find ('error')
-    
-        if (indx >= 0):
-            print (retstr)
-            sys.exit()
+        if (self.tap.status == 'error'):
+            raise NeidQueryError (retstr)
 
         """no error: 
         """
@@ -1586,9 +1472,8 @@ class Archive:
 
     def print_data (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter neid.print_data:')
+        _log.debug ('')
+        _log.debug ('Enter neid.print_data:')
 
         try:
             self.tap.print_data ()
@@ -1626,6 +1511,18 @@ class Archive:
         
         end_row (integer): ending row
 
+        workers (integer): number of files downloaded concurrently 
+            (default: 8)
+
+        resume (integer): 1 to re-request the files already in outdir from 
+            their current size, completing interrupted downloads; a file 
+            changed on the server since it was written is downloaded 
+            again in full; 0 skips them (default: 0).  An interrupted 
+            download leaves a <file>.lastmod record next to the partial 
+            file; a file without one (a complete file, or one from a run 
+            of an older version) is only compared with the server's size 
+            and downloaded again in full when they differ.
+
         Exampled:
 
             >>> Neid.download ('./criteria.tbl', 
@@ -1637,29 +1534,19 @@ class Archive:
             >>>     end_row=10)
         """
         
-        if (self.debug == 0):
+        self.__set_debug (kwargs)
 
-            if ('debugfile' in kwargs):
-            
-                self.debug = 1
-                self.debugfname = kwargs.get ('debugfile')
+        """debug-only blocks are skipped when the logger would drop 
+        their output anyway
+        """
 
-                if (len(self.debugfname) > 0):
-      
-                    logging.basicConfig (filename=self.debugfname, \
-                        level=logging.DEBUG)
-    
-                    with open (self.debugfname, 'w') as fdebug:
-                        pass
+        dbg = self.debug and _log.isEnabledFor (logging.DEBUG)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('debug turned on')
-    
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter download:')
+        _log.debug ('')
+        _log.debug ('Enter download:')
         
+        datalevel = datalevel.lower()
+
         if (len(metapath) == 0):
             print ('Failed to find required input parameter: metapath')
             return
@@ -1676,27 +1563,24 @@ class Archive:
         self.format = format
         self.outdir = outdir
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'metapath= {self.metapath:s}')
-            logging.debug (f'format= {self.format:s}')
-            logging.debug (f'outdir= {self.outdir:s}')
+        _log.debug ('')
+        _log.debug ('metapath= %s', self.metapath)
+        _log.debug ('format= %s', self.format)
+        _log.debug ('outdir= %s', self.outdir)
 
         self.token = ''
         if ('token' in kwargs): 
             self.token = kwargs.get('token')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'token= {self.token:s}')
+        _log.debug ('')
+        _log.debug ('token= %s', _redact (self.token))
 
         self.cookiepath = ''
         if ('cookiepath' in kwargs): 
             self.cookiepath = kwargs.get('cookiepath')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'cookiepath= {self.cookiepath:s}')
+        _log.debug ('')
+        _log.debug ('cookiepath= %s', self.cookiepath)
 
         """token take precedence: only load cookie if token doesn't exist
         """
@@ -1710,30 +1594,20 @@ class Archive:
 
             if (len(self.cookiepath) > 0):
    
-                cookiejar = http.cookiejar.MozillaCookieJar (self.cookiepath)
-
                 try: 
-                    cookiejar.load (ignore_discard=True, ignore_expires=True)
+                    cookiejar = _load_cookiejar (self.cookiepath)
     
-                    if self.debug:
-                        logging.debug (\
-                            f'cookie loaded from file: {self.cookiepath:s}')
+                    _log.debug ('cookie loaded from file: %s', self.cookiepath)
         
-                    for cookie in cookiejar:
-                    
-                        if self.debug:
-                            logging.debug ('')
-                            logging.debug ('cookie=')
-                            logging.debug (cookie)
-                            logging.debug (f'cookie.name= {cookie.name:s}')
-                            logging.debug (f'cookie.value= {cookie.value:s}')
-                            logging.debug (f'cookie.domain= {cookie.domain:s}')
+                    if dbg:
+                        _log.debug ('')
+                        _log.debug ('cookies:\n%s', _fmt_jar (cookiejar))
 
                 except Exception as e:
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'loadCookie exception: {str(e):s}')
-                    pass
+                    _log.debug ('')
+                    _log.debug ('loadCookie exception: %s', e)
+                    
+                    cookiejar = http.cookiejar.MozillaCookieJar (self.cookiepath)
 
         """} end load cookie to cookiejar 
         """
@@ -1756,93 +1630,70 @@ class Archive:
         except Exception as e:
             self.msg = 'Failed to read metadata table to astropy table:' + \
                 str(e) 
-            print (self.msg)
-            sys.exit()
+            raise NeidQueryError (self.msg)
 
         self.len_tbl = len(self.astropytbl)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('self.astropytbl read')
-            logging.debug (f'self.len_tbl= {self.len_tbl:d}')
+        _log.debug ('')
+        _log.debug ('self.astropytbl read')
+        _log.debug ('self.len_tbl= %d', self.len_tbl)
 
         if (self.len_tbl == 0):
-            print ('There is no data in the metadata table.')
-            sys.exit()
+            self.msg = 'There is no data in the metadata table.'
+            raise NeidQueryError (self.msg)
    
         
         self.colnames = self.astropytbl.colnames
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('self.colnames:')
-            logging.debug (self.colnames)
+        _log.debug ('')
+        _log.debug ('self.colnames:')
+        _log.debug (self.colnames)
   
         self.len_col = len(self.colnames)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'self.len_col= {self.len_col:d}')
+        _log.debug ('')
+        _log.debug ('self.len_col= %d', self.len_col)
+
+        """the level prefix of the filename/filepath columns: eng and solar 
+        eng files are listed in the l0 columns
+        """
 
-        #filenamecol = datalevel + 'filename'
-        #filepathcol = datalevel + 'filepath'
+        collevel = {'l0': 'l0', 'eng': 'l0', 'solarl0': 'l0', \
+            'solareng': 'l0', 'l1': 'l1', 'solarl1': 'l1', \
+            'l2': 'l2', 'solarl2': 'l2'}.get (datalevel, '')
 
         filenamecol = ''
         filepathcol = ''
 
-        if ((datalevel == 'l0') or \
-           (datalevel == 'eng') or \
-           (datalevel == 'solarl0') or \
-           (datalevel == 'solareng')):
-           filenamecol = 'l0filename'
-           filepathcol = 'l0filepath'
-
-        elif ((datalevel == 'l1') or \
-            (datalevel == 'eng') or \
-            (datalevel == 'solarl1') or \
-            (datalevel == 'solareng')):
-            filenamecol = 'l1filename'
-            filepathcol = 'l1filepath'
-
-        elif ((datalevel == 'l2') or \
-            (datalevel == 'eng') or \
-            (datalevel == 'solarl2') or \
-            (datalevel == 'solareng')):
-            filenamecol = 'l2filename'
-            filepathcol = 'l2filepath'
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'filenamecol= {filenamecol:s}')
-            logging.debug (f'filepathcol= {filepathcol:s}')
+        if (len(collevel) > 0):
+            filenamecol = collevel + 'filename'
+            filepathcol = collevel + 'filepath'
 
-        ind_filenamecol = -1
-        ind_filepathcol = -1
-        for i in range (0, self.len_col):
+        _log.debug ('')
+        _log.debug ('filenamecol= %s', filenamecol)
+        _log.debug ('filepathcol= %s', filepathcol)
 
-            if (self.colnames[i].lower() == filenamecol):
-                ind_filenamecol = i
+        lower_map = {name.lower(): i for i, name in enumerate(self.colnames)}
 
-            if (self.colnames[i].lower() == filepathcol):
-                ind_filepathcol = i
+        ind_filenamecol = lower_map.get (filenamecol, -1)
+        ind_filepathcol = lower_map.get (filepathcol, -1)
              
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'ind_filenamecol= {ind_filenamecol:d}')
-            logging.debug (f'ind_filepathcol= {ind_filepathcol:d}')
+        _log.debug ('')
+        _log.debug ('ind_filenamecol= %d', ind_filenamecol)
+        _log.debug ('ind_filepathcol= %d', ind_filepathcol)
       
         if (ind_filenamecol == -1):
 
             msg = "Cannot find the necessary column: [" + filenamecol + \
                 "] in the metadata table for downloading data."
-            raise Exception (msg)
+            raise NeidQueryError (msg)
 
         
         if (ind_filepathcol == -1):
 
             msg = "Cannot find the necessary column: [" + filepathcol + \
                 "] in the metadata table for downloading data."
-            raise Exception (msg)
+            raise NeidQueryError (msg)
 
     
         calibfile = 0 
@@ -1851,9 +1702,8 @@ class Archive:
         if ('calibfile' in kwargs): 
             calibfile = kwargs.get('calibfile')
          
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'calibfile= {calibfile:d}')
+        _log.debug ('')
+        _log.debug ('calibfile= %d', calibfile)
         """
 
         srow = 0;
@@ -1862,26 +1712,23 @@ class Archive:
         if ('start_row' in kwargs): 
             srow = kwargs.get('start_row')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'srow= {srow:d}')
+        _log.debug ('')
+        _log.debug ('srow= %d', srow)
      
         if ('end_row' in kwargs): 
             erow = kwargs.get('end_row')
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'erow= {erow:d}')
+        _log.debug ('')
+        _log.debug ('erow= %d', erow)
      
         if (srow < 0):
             srow = 0 
         if (erow > self.len_tbl - 1):
             erow = self.len_tbl - 1 
  
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'srow= {srow:d}')
-            logging.debug (f'erow= {erow:d}')
+        _log.debug ('')
+        _log.debug ('srow= %d', srow)
+        _log.debug ('erow= %d', erow)
      
 
         """create outdir if it doesn't exist
@@ -1895,49 +1742,28 @@ class Archive:
 
         d1 = int ('0775', 8)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'd1= {d1:d}')
+        _log.debug ('')
+        _log.debug ('d1= %d', d1)
      
         try:
             os.makedirs (self.outdir, mode=d1, exist_ok=True) 
 
         except Exception as e:
             
-            self.msg = 'Failed to create {self.outdir:s}:' + str(e) 
-            print (self.msg)
-            sys.exit()
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('returned os.makedirs') 
-
-
-        """retrieve baseurl from conf class;
-        """
-
-        self.baseurl = conf.server
+            self.msg = f'Failed to create {self.outdir:s}:' + str(e) 
+            raise NeidQueryError (self.msg)
 
-        if ('server' in kwargs):
-            self.baseurl = kwargs.get ('server')
+        _log.debug ('')
+        _log.debug ('returned os.makedirs')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'baseurl= {self.baseurl:s}')
 
-        """urls for nph-neidDownload.py
+        """url for get_file.php
         """
 
-        #self.getneid_url = self.baseurl + 'cgi-bin/NeidAPI/nph-neidDownload.py?'
-        getfile_baseurl = 'https://neid.ipac.caltech.edu/'
-
-        self.getneid_url = getfile_baseurl + 'get_file.php?'
-        #self.getneid_url = getfile_baseurl + 'get_file_pyNEID.php?'
+        self.__set_urls (kwargs)
 
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'self.getneid_url= {self.getneid_url:s}')
+        _log.debug ('')
+        _log.debug ('self.getneid_url= %s', self.getneid_url)
 
 
         filename = ''
@@ -1951,40 +1777,93 @@ class Archive:
         print (f'Start downloading {nfile:d} FITS data you requested;')
         print (f'please check your outdir: {self.outdir:s} for  progress.')
  
-        """{ download srow to erow
+        nworkers = 8
+        if ('workers' in kwargs): 
+            nworkers = int (kwargs.get('workers'))
+
+        if (nworkers < 1):
+            nworkers = 1
+
+        resume = 0
+        if ('resume' in kwargs): 
+            resume = kwargs.get('resume')
+
+        _log.debug ('')
+        _log.debug ('resume= %d', resume)
+
+        """the valueless flags appended to every download url only depend 
+        on datalevel
+        """
+
+        urlflags = ''
+        if ((datalevel == 'eng') or (datalevel == 'solareng')):
+            urlflags = urlflags + '&eng'
+
+        if ((datalevel == 'solarl0') or \
+            (datalevel == 'solarl1') or \
+            (datalevel == 'solarl2') or \
+            (datalevel == 'solareng')):
+            urlflags = urlflags + '&solar'
+
+        urlflags = urlflags + '&json'
+
+        """extract the filename and filepath columns once instead of 
+        materializing a table row per file: the astropy columns are viewed 
+        as plain numpy arrays, byte columns are decoded in bulk, and the 
+        result is turned into lists of python strings for the row loop
+        """
+
+        filenames = numpy.asarray (self.astropytbl.columns[ind_filenamecol])
+        filepaths = numpy.asarray (self.astropytbl.columns[ind_filepathcol])
+
+        if (filenames.dtype.kind == 'S'):
+
+            _log.debug ('')
+            _log.debug ('bytes: decode')
+
+            filenames = numpy.char.decode (filenames, 'utf-8')
+        
+        if (filepaths.dtype.kind == 'S'):
+            filepaths = numpy.char.decode (filepaths, 'utf-8')
+
+        filenames = filenames.tolist()
+        filepaths = filepaths.tolist()
+
+        """list outdir once rather than stat'ing every file in the loop
+        """
+
+        try:
+            with os.scandir (self.outdir) as entries:
+                existing = {entry.name for entry in entries}
+        except FileNotFoundError:
+            existing = set()
+
+        _log.debug ('')
+        _log.debug ('%d files already in outdir', len(existing))
+
+        """{ collect the files from srow to erow that need downloading
         """
 
+        dnloadlist = []
+        queued = set()
+
+        outprefix = os.path.join (self.outdir, '')
+
         for l in range (srow, erow+1):
        
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'l= {l:d}')
-                logging.debug ('')
-                logging.debug ('self.astropytbl[l]= ')
-                logging.debug (self.astropytbl[l])
-
-            filename = self.astropytbl[l][ind_filenamecol]
-            filepath = self.astropytbl[l][ind_filepathcol]
+            if dbg:
+                _log.debug ('')
+                _log.debug ('l= %d', l)
+                _log.debug ('')
+                _log.debug ('self.astropytbl[l]= ')
+                _log.debug (self.astropytbl[l])
+
+            filename = filenames[l]
+            filepath = filepaths[l]
 	    
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('type(datalevel)= ')
-                logging.debug (type(datalevel))
-                logging.debug (type(datalevel) is bytes)
-            
-            if (type (filename) is bytes):
-                
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('bytes: decode')
-
-                filename = filename.decode("utf-8")
-                filepath = filepath.decode("utf-8")
-           
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'l= {l:d} filename= {filename:s}')
-                logging.debug (f'filepath= {filepath:s}')
+            _log.debug ('')
+            _log.debug ('l= %d filename= %s', l, filename)
+            _log.debug ('filepath= %s', filepath)
 
             """get data files
             """
@@ -1992,323 +1871,453 @@ class Archive:
             #url = self.getneid_url + 'datalevel=' + datalevel + \
             #    '&filepath=' + '/' + filepath + '&debug=1'
             
-            url = self.getneid_url + 'filehand=' + filepath
-           
-            if ((datalevel == 'eng') or (datalevel == 'solareng')):
-                url = url + '&eng'
-
-            if ((datalevel == 'solarl0') or \
-                (datalevel == 'solarl1') or \
-                (datalevel == 'solarl2') or \
-                (datalevel == 'solareng')):
-                url = url + '&solar'
-
-            url = url + '&json'
+            url = self.getneid_url + \
+                urllib.parse.urlencode ({'filehand': filepath}) + urlflags
             
-            filepath = self.outdir + '/' + filename 
+            filepath = outprefix + filename 
                 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'filepath= {filepath:s}')
-                logging.debug (f'url= {url:s}')
+            _log.debug ('')
+            _log.debug ('filepath= %s', filepath)
+            _log.debug ('url= %s', url)
 
-            """if file doesn't exist: download
+            """if file doesn't exist: add to the download list
             """
 
-            isExist = os.path.exists (filepath)
+            isExist = (filename in existing)
 	    
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'isExist= {isExist:d}')
+            _log.debug ('')
+            _log.debug ('isExist= %d', isExist)
 
-            if (not isExist):
+            if (filename in queued):
+                continue
 
-                try:
-                    self.__submit_request (url, filepath, cookiejar)
-                    self.ndnloaded = self.ndnloaded + 1
+            if ((not isExist) or (resume)):
+                dnloadlist.append ((filename, url, filepath))
+                queued.add (filename)
 
-                    self.msg =  'Returned file written to: ' + filepath   
-           
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug ('returned __submit_request')
-                        logging.debug (f'self.msg= {self.msg:s}')
-            
-                except Exception as e:
-                    print (f'File [{filename:s}] download: {str(e):s}')
+        """} end download list
+        """
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'{self.len_tbl:d} files in the table;')
-            logging.debug (f'{self.ndnloaded:d} files downloaded.')
-            logging.debug (f'{self.ncaliblist:d} calibration list downloaded.')
+        _log.debug ('')
+        _log.debug ('%d files to be downloaded with %d workers', \
+            len(dnloadlist), nworkers)
+
+        """{ download the files in the list concurrently: each request
+        spends most of its time waiting on the network. The session is 
+        created up front so all worker threads share its connection pool.
+        """
+
+        self.__get_session()
+
+        with ThreadPoolExecutor (max_workers=nworkers) as executor:
+
+            futures = [executor.submit (self.__download_file, \
+                filename, url, filepath, cookiejar, resume) \
+                for (filename, url, filepath) in dnloadlist]
+
+            for future in futures:
+                self.ndnloaded = self.ndnloaded + future.result()
+
+        """} end download
+        """
+
+        _log.debug ('')
+        _log.debug ('%d files in the table;', self.len_tbl)
+        _log.debug ('%d files downloaded.', self.ndnloaded)
+        _log.debug ('%d calibration list downloaded.', self.ncaliblist)
 
 
         print (f'A total of new {self.ndnloaded:d} FITS files downloaded.')
  
         return
 
-    def __submit_request(self, url, filepath, cookiejar):
+    def __get_tap (self):
+
+        """return the NeidTap for the current tap_url, format, maxrec and 
+        credentials, reusing the one made by an earlier query when they are
+        unchanged; the cache is cleared by login.  Returns None if NeidTap 
+        could not be initialized.
+        """
+
+        key = (self.tap_url, self.format, self.maxrec, self.cookiepath, \
+            self.token, self.debug)
+
+        tap = self._tap_cache.get (key)
+
+        if (tap is not None):
+            
+            _log.debug ('')
+            _log.debug ('reuse cached NeidTap')
+            
+            return (tap)
+
+        tapkwargs = dict()
+        tapkwargs['format'] = self.format
+        tapkwargs['maxrec'] = self.maxrec
+
+        if (len(self.cookiepath) > 0):
+            tapkwargs['cookiefile'] = self.cookiepath
+        elif (len(self.token) > 0):
+            tapkwargs['token'] = self.token
 
         if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter database.__submit_request:')
-            logging.debug (f'url= {url:s}')
-            logging.debug (f'filepath= {filepath:s}')
+            tapkwargs['debug'] = 1
+
+        tapkwargs['session'] = self.__get_session()
+
+        if (self.debug) and (_log.isEnabledFor (logging.DEBUG)):
+            logkwargs = dict (tapkwargs)
+            if ('token' in logkwargs):
+                logkwargs['token'] = _redact (logkwargs['token'])
+
+            _log.debug ('')
+            _log.debug ('tapkwargs= %s', logkwargs)
        
-            if not (cookiejar is None):  
+        try:
+            tap = NeidTap (self.tap_url, **tapkwargs)
+                
+        except Exception as e:
             
-                for cookie in cookiejar:
+            _log.debug ('')
+            _log.debug ('Error: %s', e)
                     
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug ('cookie saved:')
-                        logging.debug (f'cookie.name= {cookie.name:s}')
-                        logging.debug (f'cookie.value= {cookie.value:s}')
-                        logging.debug (f'cookie.domain= {cookie.domain:s}')
+            print (str(e))
+            return (None)
+
+        self._tap_cache[key] = tap
+
+        return (tap)
+
+    def __download_file (self, filename, url, filepath, cookiejar, resume):
+
+        """download one file in a worker thread of the download method; 
+        returns the number of files downloaded (1 or 0) 
+        """
+
+        try:
+            (msg, ndnloaded) = self.__submit_request (url, filepath, \
+                cookiejar, resume=resume)
+
+            _log.debug ('')
+            _log.debug ('returned __submit_request')
+            _log.debug ('msg= %s', msg)
+            
+        except Exception as e:
+            print (f'File [{filename:s}] download: {str(e):s}')
+            return (0)
+
+        return (ndnloaded)
+
+    def __submit_request(self, url, filepath, cookiejar, resume=0):
+
+        """download url to filepath; returns (msg, 1) when the file was 
+        written and (msg, 0) when a resumed file was already complete
+        """
+
+        _log.debug ('')
+        _log.debug ('Enter database.__submit_request:')
+        _log.debug ('url= %s', url)
+        _log.debug ('filepath= %s', filepath)
+       
+        dbg = self.debug and _log.isEnabledFor (logging.DEBUG)
+
+        if (dbg) and (not (cookiejar is None)):  
+            _log.debug ('')
+            _log.debug ('cookies:\n%s', _fmt_jar (cookiejar))
             
+        """only local variables are set here since download calls this 
+        method from several worker threads at once
+        """
+
+        status = ''
+        msg = ''
+
+        """resume: ask only for the bytes past the end of the partial file.
+        The server's Last-Modified is recorded in a sidecar file while the 
+        file is written and sent back as If-Range: if the file changed on 
+        the server the whole file is sent instead of a range appended to a 
+        stale prefix.  A file without the record (complete, or written by 
+        an older version) is compared with the server's size from a HEAD 
+        request: it is skipped when the sizes match, downloaded again in 
+        full otherwise.
+        """
+
+        offset = 0
+        lastmod = ''
+        if (resume):
+            try:
+                offset = os.stat (filepath).st_size
+            except OSError:
+                offset = 0
+
+            if (offset > 0):
+                lastmod = _read_lastmod (filepath)
+
+        headers = dict()
+        if (len(lastmod) > 0):
+            headers['Range'] = f'bytes={offset:d}-'
+            headers['If-Range'] = lastmod
+
+        elif (offset > 0):
+
+            size = self.__remote_size (url, cookiejar)
+
+            _log.debug ('')
+            _log.debug ('no Last-Modified recorded: remote size= %d', size)
+
+            if (size == offset):
+                msg = 'File already complete: ' + filepath
+                return ((msg, 0))
+
+            offset = 0
+
+        _log.debug ('')
+        _log.debug ('offset= %d', offset)
+
+        response = None
         try:
-            self.response =  requests.get (url, cookies=cookiejar, \
-                stream=True)
+            response =  self.__get_session().get (url, cookies=cookiejar, \
+                headers=headers, stream=True)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('request sent')
+            _log.debug ('')
+            _log.debug ('request sent')
         
         except Exception as e:
             
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'exception: {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: %s', e)
 
-            self.status = 'error'
-            self.msg = 'Failed to submit the request: ' + str(e)
+            status = 'error'
+            msg = 'Failed to submit the request: ' + str(e)
 	    
-            raise Exception (self.msg)
-            return
+            raise Exception (msg)
                        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('status_code:')
-            logging.debug (self.response.status_code)
+        _log.debug ('')
+        _log.debug ('status_code:')
+        _log.debug (response.status_code)
       
       
-        if (self.response.status_code == 200):
-            self.status = 'ok'
-            self.msg = ''
+        if ((offset > 0) and (response.status_code == 416)):
+
+            """the range starts at the end of the file: it is complete
+            """
+
+            response.close()
+            _write_lastmod (filepath, '')
+
+            msg = 'File already complete: ' + filepath
+            return ((msg, 0))
+
+        if ((response.status_code == 200) or (response.status_code == 206)):
+            status = 'ok'
+            msg = ''
         else:
-            self.status = 'error'
-            self.msg = 'Failed to submit the request'
+            response.close()
+
+            status = 'error'
+            msg = 'Failed to submit the request'
 	    
-            raise Exception (self.msg)
-            return
+            raise Exception (msg)
                        
             
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('headers: ')
-            logging.debug (self.response.headers)
+        _log.debug ('')
+        _log.debug ('headers: ')
+        _log.debug (response.headers)
       
       
-        self.content_type = ''
-        try:
-            self.content_type = self.response.headers['Content-type']
-        except Exception as e:
-
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'exception extract content-type: {str(e):s}')
+        content_type = _content_type (response)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'content_type= {self.content_type:s}')
+        _log.debug ('')
+        _log.debug ('content_type= %s', content_type)
 
 
-        if (self.content_type == 'application/json'):
+        if (content_type == 'application/json'):
             
-            if self.debug:
-                logging.debug ('')
-                logging.debug (\
-                    'return is a json structure: might be error message')
+            _log.debug ('')
+            _log.debug ('return is a json structure: might be error message')
             
-            jsondata = json.loads (self.response.text)
+            jsondata = _loads (response.content)
           
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('jsondata:')
-                logging.debug (jsondata)
+            _log.debug ('')
+            _log.debug ('jsondata:')
+            _log.debug (jsondata)
 
  
-            self.status = ''
-            try: 
-                self.status = jsondata['status']
-                
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'self.status= {self.status:s}')
-
-            except Exception as e:
-
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'get status exception: e= {str(e):s}')
+            status = jsondata.get ('status', '')
+            msg = jsondata.get ('msg', '')
+            errmsg = jsondata.get ('error', '')
 
-            self.msg = '' 
-            try: 
-                self.msg = jsondata['msg']
-                
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'self.msg= {self.msg:s}')
+            if (len(errmsg) > 0):
+                status = 'error'
+                msg = errmsg
 
-            except Exception as e:
+            _log.debug ('')
+            _log.debug ('status= %s', status)
+            _log.debug ('msg= %s', msg)
 
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract msg exception: e= {str(e):s}')
 
-            errmsg = ''        
-            try: 
-                errmsg = jsondata['error']
-                
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'errmsg= {errmsg:s}')
+            if (status == 'error'):
+                response.close()
+                raise Exception (msg)
 
-                if (len(errmsg) > 0):
-                    self.status = 'error'
-                    self.msg = errmsg
+        """save to filepath
+        """
 
-            except Exception as e:
+        _log.debug ('')
+        _log.debug ('save_to_file:')
+       
+        """copy the raw stream straight to the file in 2 MiB blocks; only 
+        let urllib3 decode the body when the server actually compressed it
+        """
 
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'get error exception: e= {str(e):s}')
+        encoding = response.headers.get ('Content-Encoding', '')
+        response.raw.decode_content = (len(encoding) > 0)
 
+        """206: the server honoured the range, append to the partial file;
+        200: the whole file was sent, rewrite it
+        """
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'self.status= {self.status:s}')
-                logging.debug (f'self.msg= {self.msg:s}')
+        append = (response.status_code == 206)
 
+        """record the validator before writing so an interrupted file can 
+        be resumed; it is dropped once the file is complete.  A compressed
+        body is not resumed: its ranges are not those of the file.
+        """
 
-            if (self.status == 'error'):
-                raise Exception (self.msg)
-                return
+        lastmod = ''
+        if (len(encoding) == 0):
+            lastmod = response.headers.get ('Last-Modified', '')
 
-        """save to filepath
-        """
+        _write_lastmod (filepath, lastmod)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('save_to_file:')
-       
         try:
-            with open (filepath, 'wb') as fd:
-
-                for chunk in self.response.iter_content (chunk_size=1024):
-                    fd.write (chunk)
+            _write_stream (response.raw, filepath, append=append)
             
-            self.msg =  'Returned file written to: ' + filepath   
+            _write_lastmod (filepath, '')
+
+            msg =  'Returned file written to: ' + filepath   
             
-            if self.debug:
-                logging.debug ('')
-                logging.debug (self.msg)
+            _log.debug ('')
+            _log.debug (msg)
 	
         except Exception as e:
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'exception: {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: %s', e)
 
-            self.status = 'error'
-            self.msg = 'Failed to save returned data to file: %s' % filepath
+            status = 'error'
+            msg = 'Failed to save returned data to file: %s' % filepath
             
-            raise Exception (self.msg)
-            return
+            raise Exception (msg)
 
-        return
+        finally:
+
+            """hand the connection back to the pool even when the write 
+            failed part way: download runs this from several threads and 
+            a leaked response holds one of the pooled sockets
+            """
+
+            response.close()
+
+        return ((msg, 1))
+    
+    def __remote_size (self, url, cookiejar):
+
+        """the Content-Length of url from a HEAD request, -1 when the 
+        request fails or the server does not give it
+        """
+
+        try:
+            response = self.__get_session().head (url, cookies=cookiejar, \
+                allow_redirects=True)
+            response.close()
+
+            if (response.status_code != 200):
+                return (-1)
+
+            return (int (response.headers.get ('Content-Length', -1)))
+
+        except Exception as e:
+            
+            _log.debug ('')
+            _log.debug ('HEAD exception: %s', e)
+
+            return (-1)
     
     def __make_query (self, url):
        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter __make_query:')
-            logging.debug (f'url= {url:s}')
+        _log.debug ('')
+        _log.debug ('Enter __make_query:')
+        _log.debug ('url= %s', url)
 
         response = None
         try:
-            response = requests.get (url, stream=True)
+            response = self.__get_session().get (url, stream=True)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('request sent')
+            _log.debug ('')
+            _log.debug ('request sent')
 
         except Exception as e:
            
             self.msg = 'Error: ' + str(e)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'exception: e= {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: e= %s', e)
             
             raise Exception (self.msg)
 
 
-        content_type = response.headers['content-type']
+        content_type = _content_type (response)
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'content_type= {content_type:s}')
+        _log.debug ('')
+        _log.debug ('content_type= %s', content_type)
       
         query = ''
         if (content_type == 'application/json'):
                 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'response.text: {response.text:s}')
-
-            """error message
+            """error message: read the body once, as bytes
             """
 
-            try:
-                jsondata = json.loads (response.text)
-                 
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('jsondata loaded')
-                
-                self.status = jsondata['status']
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'status: {self.status:s}')
-
-
-                if (self.status == 'ok'):
-                    query = jsondata['query']
-                    
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'query: {self.query:s}')
+            body = response.content
 
-                else:
-                    self.msg = jsondata['msg']
-                    
-                    if self.debug:
-                        logging.debug ('')
-                        logging.debug (f'msg: {self.msg:s}')
+            _log.debug ('')
+            _log.debug ('response.content: %s', body)
 
-                    raise Exception (self.msg)
+            try:
+                jsondata = _loads (body)
 
             except Exception:
                 self.msg = 'returned JSON object parse error'
                 
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('JSON object parse error')
-      
+                _log.debug ('')
+                _log.debug ('JSON object parse error')
+                
+                raise Exception (self.msg)
+                 
+            _log.debug ('')
+            _log.debug ('jsondata loaded')
+
+            """the server's error message is raised as is, outside the 
+            parse try block
+            """
+
+            self.status = jsondata.get ('status', '')
+            
+            _log.debug ('')
+            _log.debug ('status: %s', self.status)
+
+            if (self.status != 'ok'):
+                self.msg = jsondata.get ('msg', '')
                 
+                _log.debug ('')
+                _log.debug ('msg: %s', self.msg)
+
                 raise Exception (self.msg)
+
+            query = jsondata.get ('query', '')
+                    
+            _log.debug ('')
+            _log.debug ('query: %s', query)
             
         return (query)
     
@@ -2326,24 +2335,20 @@ class objLookup(object):
 
 
     lookupurl = 'https://exoplanetarchive.ipac.caltech.edu/cgi-bin/Lookup/nph-lookup?'
-    msg = ''
-    status = ''
 
-    url = ''
-    response = None 
+    """the resolved parameters copied from the returned json structure;
+    a missing one stays an empty string
+    """
+
+    _FIELDS = ('source', 'objname', 'objtype', 'objdesc', 'parsename', \
+        'ra2000', 'dec2000', 'cra2000', 'cdec2000')
 
-    source = ''
-    input = ''
-    objname = ''
-    objtype = ''
-    parsename= ''
-    objdesc = ''
-    ra2000= ''
-    dec2000 = ''
-    cra2000 = ''
-    cdec2000 = ''
+    """a catalog scan may build thousands of lookups: no per-instance 
+    __dict__
+    """
 
-    debug = 0
+    __slots__ = ('object', 'msg', 'status', 'url', 'response', 'input', \
+        'debug') + _FIELDS
 
     """{ objLookup.init
     """
@@ -2351,174 +2356,113 @@ class objLookup(object):
 
         self.object = object
 
+        self.msg = ''
+        self.status = ''
+        self.url = ''
+        self.response = None
+        self.input = ''
+        self.debug = 0
+
+        for field in self._FIELDS:
+            setattr (self, field, '')
+
         if ('debug' in kwargs):
             self.debug = kwargs['debug']
 
-        self.url = self.lookupurl + 'location=' + self.object
+        """object names may contain spaces, '+' or non-ASCII characters
+        """
+
+        self.url = self.lookupurl + \
+            urllib.parse.urlencode ({'location': self.object})
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'url={self.url:s}')
+        """the caller's http session (e.g. Archive's) is reused when given
+        """
+
+        session = None
+        if ('session' in kwargs):
+            session = kwargs['session']
+
+        if (session is None):
+            session = _get_session()
+
+        _log.debug ('')
+        _log.debug ('url=%s', self.url)
 
 
         self.response = None 
         try:
-            self.response = requests.get (self.url, stream=True)
+            self.response = session.get (self.url, stream=True)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'response:')
-                logging.debug (self.response)
+            _log.debug ('')
+            _log.debug ('response:')
+            _log.debug (self.response)
 
         except Exception as e:
-            self.msg = f'submit request exception: {str(e):s}'
-            raise Exception (self.msg)
+            self.__fail (f'submit request exception: {str(e):s}')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (
-                f'response.statu_code= {self.response.status_code:d}')
+        _log.debug ('')
+        _log.debug ('response.statu_code= %d', self.response.status_code)
 
-            logging.debug ('response.headers:')
-            logging.debug (self.response.headers)
+        _log.debug ('response.headers:')
+        _log.debug (self.response.headers)
 
-            logging.debug ('response.text:')
-            logging.debug (self.response.text)
+        """the body is read once, as bytes, for the log and json parser
+        """
 
+        body = self.response.content
 
-        content_type = ''
-        try:
-            content_type = self.response.headers['Content-type']
-        
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'content_type= {content_type:s}')
+        _log.debug ('response.content:')
+        _log.debug (body)
 
-        except Exception as e:
-            self.msg = f'extract content_type exception: {str(e):s}'
-            raise Exception (self.msg)
+
+        content_type = _content_type (self.response)
+        
+        _log.debug ('')
+        _log.debug ('content_type= %s', content_type)
 
 
         jsondata = None
         try:
-            jsondata = json.loads (self.response.text)
+            jsondata = _loads (body)
 
         except Exception as e:
-            self.msg = f'load jsondata exception: {str(e):s}'
-            raise Exception (self.msg)
+            self.__fail (f'load jsondata exception: {str(e):s}')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('jsondata:')
-            logging.debug (jsondata)
+        _log.debug ('')
+        _log.debug ('jsondata:')
+        _log.debug (jsondata)
 
         
         self.status = ''
         try:
             self.status = jsondata['stat']
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'self.status= {self.status:s}')
+            _log.debug ('')
+            _log.debug ('self.status= %s', self.status)
 
         except Exception as e:
+            self.__fail (f'extract stat exception: {str(e):s}')
 
-            self.msg = f'extract stat exception: {str(e):s}'
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'self.msg= {self.msg:s}')
-            
-            raise Exception (self.msg)
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'got here: status= {self.status:s}')
-       
-    
         if (self.status.lower() == 'ok'):
         
             """{  objLookup OK, extract parameters
             """
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('xxx1')
+            _log.debug ('')
+            _log.debug ('lookup ok: extract fields')
        
-            try:
-                self.source = jsondata['source']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract source exception: {str(e):s}')
-    
-            try:
-                self.objname = jsondata['objname']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract objname exception: {str(e):s}')
-                
-            try:
-                self.objtype = jsondata['objtype']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract objtype exception: {str(e):s}')
-                
-            try:
-                self.objdesc = jsondata['objdesc']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract objdesc exception: {str(e):s}')
-                
-            try:
-                self.parsename = jsondata['parsename']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract parsename exception: {str(e):s}')
-                
-            try:
-                self.ra2000 = jsondata['ra2000']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract ra2000 exception: {str(e):s}')
-                
-            try:
-                self.dec2000 = jsondata['dec2000']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract dec2000 exception: {str(e):s}')
-                
-            try:
-                self.cra2000 = jsondata['cra2000']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract cra2000 exception: {str(e):s}')
-                
-            try:
-                self.cdec2000 = jsondata['cdec2000']
-            except Exception as e:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'extract cdec20000 exception: {str(e):s}')
+            for field in self._FIELDS:
+                setattr (self, field, jsondata.get (field, ''))
+
+            """one debug line lists the fields the resolver did not return
+            """
+
+            if (self.debug) and (_log.isEnabledFor (logging.DEBUG)):
                 
-            if self.debug:
-                logging.debug ('')
+                missing = [field for field in self._FIELDS \
+                    if field not in jsondata]
                 
-                logging.debug (f'dec2000= {self.dec2000:s}')
-                logging.debug (f'source= {self.source:s}')
-                logging.debug (f'objname= {self.objname:s}')
-                logging.debug (f'objtype= {self.objtype:s}')
-                logging.debug (f'objdesc= {self.objdesc:s}')
-                logging.debug (f'parsename= {self.parsename:s}')
-                logging.debug (f'ra2000= {self.ra2000:s}')
-                logging.debug (f'dec2000= {self.dec2000:s}')
-                logging.debug (f'cra2000= {self.cra2000:s}')
-                logging.debug (f'cdec2000= {self.cdec2000:s}')
+                _log.debug ('')
+                _log.debug ('missing fields: %s', missing)
 
             """}  end objLookup OK, extract parameters
             """
@@ -2528,28 +2472,37 @@ class objLookup(object):
             """{  objLookup Error, extract errmsg
             """
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('xxx2')
+            _log.debug ('')
+            _log.debug ('lookup failed: extract msg')
        
             self.status = 'error'
             try:
                 self.msg = jsondata['msg']
                 
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'errmsg= {self.msg:s}')
+                _log.debug ('')
+                _log.debug ('errmsg= %s', self.msg)
         
             except Exception as e:
-
-                self.msg = f'extract msg exception: {str(e):s}'
-                raise Exception (self.msg)
+                self.__fail (f'extract msg exception: {str(e):s}')
 
             """}  end extract errmsg
             """
 
         return
     
+    def __fail (self, msg):
+
+        """record a failed lookup and raise its message
+        """
+
+        self.status = 'error'
+        self.msg = msg
+        
+        _log.debug ('')
+        _log.debug ('self.msg= %s', self.msg)
+
+        raise NeidQueryError (self.msg)
+    
 class NeidTap(object):
     """
         NeidTap class provides client access to NEID's TAP service.
@@ -2565,6 +2518,23 @@ class NeidTap(object):
 	    maxrec (int): (optional) default '2000'
         cookiefile (string): a full path cookie file containing user info        
         debug (bool): default False
+        poll_interval (float): (send_async, get_data, optional) first 
+            wait between job status polls in seconds, default 0.25; it 
+            grows 1.5x after each poll
+        max_poll_interval (float): (send_async, get_data, optional) 
+            longest wait between job status polls in seconds, default 10
+        columns (list): (send_async, send_sync, optional) field IDs (names
+            for fields without an ID) or indices of the columns to keep 
+            when a votable result is saved in memory; 
+            the other columns are skipped by the parser; default all
+        tmpdir (string): (send_async, send_sync, optional) directory a 
+            large ascii result saved in memory spills to while it is 
+            read; default the system temporary directory (TMPDIR)
+        keep_raw (bool): (send_async, send_sync, optional) keep the 
+            returned bytes of an ascii result saved in memory until 
+            get_data copies them to its resultpath as is, at the cost of
+            holding the result twice; default False, get_data writes 
+            astropytbl
 
     Examples:
         >>> service = NeidTap(url, cookiefile=cookiepath)
@@ -2574,6 +2544,8 @@ class NeidTap(object):
         >>> job = service.send_async (query, format='votable', request='doQuery', ...)
         # or    
         >>> job = service.send_sync (query, format='votable', request='doQuery', ...)
+        # and, for several async jobs at once
+        >>> await asyncio.gather (*[tap.get_data_async (path) for ...])
 
     """
     def __init__ (self, url, **kwargs):
@@ -2590,6 +2562,9 @@ class NeidTap(object):
         self.response_result = None 
               
         self.outpath = ''
+        self.columns = None
+        self.tmpdir = None
+        self.keep_raw = False
         
         self.debug = 0  
  
@@ -2604,29 +2579,44 @@ class NeidTap(object):
 
         self.tapjob = None
         self.astropytbl = None
+
+        """spooled bytes of an ascii result saved in memory, kept only with
+        keep_raw so that get_data can copy them instead of re-serializing 
+        astropytbl
+        """
+
+        self._raw_result = None
         
+        """http session: the caller's (e.g. Archive's) when given; it is 
+        passed on to the TapJob polling the async job status
+        """
+
+        self._session = None
+        if ('session' in kwargs):
+            self._session = kwargs.get('session')
+
+        if (self._session is None):
+            self._session = _get_session()
+
         if ('debug' in kwargs):
             self.debug = kwargs.get('debug') 
  
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('')
-            logging.debug ('Enter neidtap.init (debug on)')
+        _log.debug ('')
+        _log.debug ('')
+        _log.debug ('Enter neidtap.init (debug on)')
                                 
         if ('cookiefile' in kwargs):
             self.cookiepath = kwargs.get('cookiefile')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'cookiepath= {self.cookiepath:s}')
+        _log.debug ('')
+        _log.debug ('cookiepath= %s', self.cookiepath)
 
         self.token = ''
         if ('token' in kwargs):
             self.token = kwargs.get('token')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'token= {self.token:s}')
+        _log.debug ('')
+        _log.debug ('token= %s', _redact (self.token))
 
 
         self.request = 'doQuery'
@@ -2645,66 +2635,60 @@ class NeidTap(object):
         if ('format' in kwargs):
            self.format = kwargs.get('format')
 
+        """maxrec is kept as str: it is only ever posted to the server
+        """
+
         self.maxrec = '0'
         if ('maxrec' in kwargs):
-           self.maxrec = kwargs.get('maxrec')
+           self.maxrec = str (kwargs.get('maxrec'))
 
         self.propflag = 1 
         if ('propflag' in kwargs):
             self.propflag = kwargs.get('propflag')
             
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'url= {self.url:s}')
-            logging.debug (f'cookiepath= {self.cookiepath:s}')
-            logging.debug (f'propflag= {self.propflag:d}')
+        _log.debug ('')
+        _log.debug ('url= %s', self.url)
+        _log.debug ('cookiepath= %s', self.cookiepath)
+        _log.debug ('propflag= %d', self.propflag)
 
-        """turn on server debug
+        """parameters that stay the same for every query of this service
+        are stringified once into (key, value) pairs; datadict holds the 
+        ones send_async/send_sync set per query.  requests.post encodes
+        the concatenated list of pairs.
         """
 
-        pid = os.getpid()
-        self.datadict['request'] = self.request              
-        self.datadict['lang'] = self.lang              
-        self.datadict['phase'] = self.phase              
-        self.datadict['format'] = self.format              
-        self.datadict['maxrec'] = self.maxrec              
-        self.datadict['propflag'] = self.propflag              
+        static = [('request', self.request), ('lang', self.lang), \
+            ('phase', self.phase), ('propflag', self.propflag)]
         if (len(self.token) > 0):
-            self.datadict['token'] = self.token              
+            static.append (('token', self.token))
 
-        for key in self.datadict:
+        self._static_data = [(key, str (val)) for (key, val) in static]
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'key= {key:s} val= {str(self.datadict[key]):s}')
+        self.datadict['format'] = str (self.format)
+        self.datadict['maxrec'] = self.maxrec              
+
+        if (self.debug) and (_log.isEnabledFor (logging.DEBUG)):
+            for (key, val) in self._static_data + \
+                list (self.datadict.items()):
+                if (key == 'token'):
+                    val = _redact (val)
+                _log.debug ('')
+                _log.debug ('key= %s val= %s', key, val)
     
         
         self.cookiejar = http.cookiejar.MozillaCookieJar (self.cookiepath)
          
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('cookiejar')
-            logging.debug (self.cookiejar)
-   
         if (len(self.cookiepath) > 0):
         
             try:
-                self.cookiejar.load (ignore_discard=True, ignore_expires=True);
+                self.cookiejar = _load_cookiejar (self.cookiepath)
             
-                if self.debug:
-                    logging.debug (
-                        'cookie loaded from %s' % self.cookiepath)
-        
-                    for cookie in self.cookiejar:
-                        logging.debug ('cookie:')
-                        logging.debug (cookie)
-                        
-                        logging.debug (f'cookie.name= {cookie.name:s}')
-                        logging.debug (f'cookie.value= {cookie.value:s}')
-                        logging.debug (f'cookie.domain= {cookie.domain:s}')
+                _log.debug ('cookie loaded from %s', self.cookiepath)
+        
+                if (self.debug) and (_log.isEnabledFor (logging.DEBUG)):
+                    _log.debug ('cookies:\n%s', _fmt_jar (self.cookiejar))
             except:
-                if self.debug:
-                    logging.debug ('NeidTap: loadCookie exception')
+                _log.debug ('NeidTap: loadCookie exception')
  
                 self.msg = 'Error: failed to load cookie file.'
                 raise Exception (self.msg) 
@@ -2718,19 +2702,27 @@ class NeidTap(object):
         if ('debug' in kwargs):
             debug = kwargs.get('debug') 
 
-        if debug:
-            logging.debug ('')
-            logging.debug ('Enter send_async:')
+        _log.debug ('')
+        _log.debug ('Enter send_async:')
  
         self.async_job = 1
         self.sync_job = 0
 
-        url = self.url + '/async'
+        """Archive reuses a NeidTap for consecutive queries: clear the 
+        results of the previous one
+        """
 
-        if debug:
-            logging.debug ('')
-            logging.debug (f'url= {url:s}')
-            logging.debug (f'query= {query:s}')
+        self.status = ''
+        self.msg = ''
+        self.tapjob = None
+        self.astropytbl = None
+        self.response_result = None
+
+        url = urllib.parse.urljoin (self.url.rstrip('/') + '/', 'async')
+
+        _log.debug ('')
+        _log.debug ('url= %s', url)
+        _log.debug ('query= %s', query)
 
         self.datadict['query'] = query 
 
@@ -2742,90 +2734,98 @@ class NeidTap(object):
         if ('format' in kwargs):
             
             self.format = kwargs.get('format')
-            self.datadict['format'] = self.format              
+            self.datadict['format'] = str (self.format)
 
-            if debug:
-                logging.debug ('')
-                logging.debug (f'format= {self.format:s}')
+            _log.debug ('')
+            _log.debug ('format= %s', self.format)
             
         if ('maxrec' in kwargs):
             
-            self.maxrec = kwargs.get('maxrec')
+            self.maxrec = str (kwargs.get('maxrec'))
             self.datadict['maxrec'] = self.maxrec              
             
-            if debug:
-                logging.debug ('')
-                logging.debug (f'maxrec= {self.maxrec:d}')
+            _log.debug ('')
+            _log.debug ('maxrec= %s', self.maxrec)
+        
+        self.datadict['debug'] = str (self.debug)
         
-        self.datadict['debug'] = self.debug              
+        data = self._static_data + list (self.datadict.items())
             
-        for key in self.datadict:
-
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'key= {key:s} val= {str(self.datadict[key]):s}')
+        if (self.debug) and (_log.isEnabledFor (logging.DEBUG)):
+            for (key, val) in data:
+                if (key == 'token'):
+                    val = _redact (val)
+                _log.debug ('')
+                _log.debug ('key= %s val= %s', key, val)
     
-        self.oupath = ''
+        self.outpath = ''
         if ('outpath' in kwargs):
             self.outpath = kwargs.get('outpath')
+
+        self.columns = None
+        if ('columns' in kwargs):
+            self.columns = kwargs.get('columns')
+
+        self.tmpdir = None
+        if ('tmpdir' in kwargs):
+            self.tmpdir = kwargs.get('tmpdir')
+
+        self.keep_raw = False
+        if ('keep_raw' in kwargs):
+            self.keep_raw = kwargs.get('keep_raw')
   
         try:
 
             if (len(self.cookiepath) > 0):
         
-                self.response = requests.post (url, data= self.datadict, \
-	            cookies=self.cookiejar, allow_redirects=False)
+                self.response = self._session.post (url, \
+                    data= data, cookies=self.cookiejar, \
+                    allow_redirects=False)
             else: 
-                self.response = requests.post (url, data= self.datadict, \
-	            allow_redirects=False)
+                self.response = self._session.post (url, \
+                    data= data, allow_redirects=False)
 
-            if debug:
-                logging.debug ('')
-                logging.debug ('request sent')
+            _log.debug ('')
+            _log.debug ('request sent')
 
         except Exception as e:
            
             self.status = 'error'
             self.msg = 'Error: ' + str(e)
 	    
-            if debug:
-                logging.debug ('')
-                logging.debug (f'exception: e= {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: e= %s', e)
             
             return (self.msg)
 
      
         self.statusurl = ''
 
-        if debug:
-            logging.debug ('')
-            logging.debug (f'status_code= {self.response.status_code:d}')
-            logging.debug ('self.response: ')
-            logging.debug (self.response)
-            logging.debug ('self.response.headers: ')
-            logging.debug (self.response.headers)
+        _log.debug ('')
+        _log.debug ('status_code= %d', self.response.status_code)
+        _log.debug ('self.response: ')
+        _log.debug (self.response)
+        _log.debug ('self.response.headers: ')
+        _log.debug (self.response.headers)
             
-        if debug:
-            logging.debug ('')
-            logging.debug (f'status_code= {self.response.status_code:d}')
+        _log.debug ('')
+        _log.debug ('status_code= %d', self.response.status_code)
             
         """if status_code != 303: probably error message
         """
 
         if (self.response.status_code != 303):
             
-            if debug:
-                logging.debug ('')
-                logging.debug ('case: not re-direct')
+            _log.debug ('')
+            _log.debug ('case: not re-direct')
        
-            self.content_type = self.response.headers['Content-type']
+            self.content_type = _content_type (self.response)
             self.encoding = self.response.encoding
         
-            if debug:
-                logging.debug ('')
-                logging.debug (f'content_type= {self.content_type:s}')
-                logging.debug ('encoding= ')
-                logging.debug (self.encoding)
+            _log.debug ('')
+            _log.debug ('content_type= %s', self.content_type)
+            _log.debug ('encoding= ')
+            _log.debug (self.encoding)
 
 
             data = None
@@ -2837,37 +2837,35 @@ class NeidTap(object):
                 """error message
                 """
 
-                if debug:
-                    logging.debug ('')
-                    logging.debug ('self.response:')
-                    logging.debug (self.response.text)
+                body = self.response.content
+
+                _log.debug ('')
+                _log.debug ('self.response:')
+                _log.debug (body)
       
                 try:
-                    data = self.response.json()
+                    data = _loads (body)
                     
                 except Exception as e:
                 
-                    if debug:
-                        logging.debug ('')
-                        logging.debug (f'JSON object parse error: {str(e):s}')
+                    _log.debug ('')
+                    _log.debug ('JSON object parse error: %s', e)
       
                     self.status = 'error'
                     self.msg = 'JSON parse error: ' + str(e)
                 
-                    if debug:
-                        logging.debug ('')
-                        logging.debug (f'status= {self.status:s}')
-                        logging.debug (f'msg= {self.msg:s}')
+                    _log.debug ('')
+                    _log.debug ('status= %s', self.status)
+                    _log.debug ('msg= %s', self.msg)
 
                     return (self.msg)
 
                 self.status = data['status']
                 self.msg = data['msg']
                 
-                if debug:
-                    logging.debug ('')
-                    logging.debug (f'status= {self.status:s}')
-                    logging.debug (f'msg= {self.msg:s}')
+                _log.debug ('')
+                _log.debug ('status= %s', self.status)
+                _log.debug ('msg= %s', self.msg)
 
                 if (self.status == 'error'):
                     self.msg = 'Error: ' + data['msg']
@@ -2880,11 +2878,11 @@ class NeidTap(object):
         if (self.response.status_code == 303):
             self.statusurl = self.response.headers['Location']
 
-        if debug:
-            logging.debug ('')
-            logging.debug (f'statusurl= {self.statusurl:s}')
+        _log.debug ('')
+        _log.debug ('statusurl= %s', self.statusurl)
 
         if (len(self.statusurl) == 0):
+            self.status = 'error'
             self.msg = 'Error: failed to retrieve statusurl from re-direct'
             return (self.msg)
 
@@ -2893,15 +2891,14 @@ class NeidTap(object):
         try:
             if (debug):
                 self.tapjob = TapJob (\
-                    self.statusurl, debug=1)
+                    self.statusurl, debug=1, session=self._session)
             else:
                 self.tapjob = TapJob (\
-                    self.statusurl)
+                    self.statusurl, session=self._session)
         
-            if debug:
-                logging.debug ('')
-                logging.debug (f'tapjob instantiated')
-                logging.debug (f'phase= {self.tapjob.phase:s}')
+            _log.debug ('')
+            _log.debug ('tapjob instantiated')
+            _log.debug ('phase= %s', self.tapjob.phase)
        
        
         except Exception as e:
@@ -2909,9 +2906,8 @@ class NeidTap(object):
             self.status = 'error'
             self.msg = 'Error: ' + str(e)
 	    
-            if debug:
-                logging.debug ('')
-                logging.debug (f'exception: e= {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: e= %s', e)
             
             return (self.msg)    
         
@@ -2920,27 +2916,14 @@ class NeidTap(object):
         
         phase = self.tapjob.phase
         
-        if debug:
-            logging.debug ('')
-            logging.debug (f'phase: {phase:s}')
-            
-        if ((phase.lower() != 'completed') and (phase.lower() != 'error')):
+        _log.debug ('')
+        _log.debug ('phase: %s', phase)
             
-            while ((phase.lower() != 'completed') and \
-                (phase.lower() != 'error')):
-                
-                time.sleep (2)
-                phase = self.tapjob.get_phase()
-        
-                if debug:
-                    logging.debug ('')
-                    logging.debug ('here0-1')
-                    logging.debug (f'phase= {phase:s}')
+        phase = self.__wait_for_job (phase, **kwargs)
             
-        if debug:
-            logging.debug ('')
-            logging.debug ('here0-2')
-            logging.debug (f'phase= {phase:s}')
+        _log.debug ('')
+        _log.debug ('here0-2')
+        _log.debug ('phase= %s', phase)
             
         """phase == 'error'
         """
@@ -2949,55 +2932,51 @@ class NeidTap(object):
             self.status = 'error'
             self.msg = self.tapjob.errorsummary
         
-            if debug:
-                logging.debug ('')
-                logging.debug (f'returned get_errorsummary: {self.msg:s}')
+            _log.debug ('')
+            _log.debug ('returned get_errorsummary: %s', self.msg)
             
             return (self.msg)
 
-        if debug:
-            logging.debug ('')
-            logging.debug ('here2: phase is completed')
+        _log.debug ('')
+        _log.debug ('here2: phase is completed')
             
         """phase == 'completed' 
         """
         self.resulturl = self.tapjob.resulturl
-        if debug:
-            logging.debug ('')
-            logging.debug (f'resulturl= {self.resulturl:s}')
+        _log.debug ('')
+        _log.debug ('resulturl= %s', self.resulturl)
 
         """send resulturl to retrieve result table
         """
         try:
-            self.response_result = requests.get (self.resulturl, stream=True)
+            self.response_result = self._session.get (self.resulturl, \
+                stream=True)
         
-            if debug:
-                logging.debug ('')
-                logging.debug ('resulturl request sent')
+            _log.debug ('')
+            _log.debug ('resulturl request sent')
 
         except Exception as e:
            
             self.status = 'error'
             self.msg = 'Error: ' + str(e)
 	    
-            if debug:
-                logging.debug ('')
-                logging.debug (f'exception: e= {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: e= %s', e)
             
             raise Exception (self.msg)    
      
        
         """save table to file
         """
-        if debug:
-            logging.debug ('')
-            logging.debug ('write data to outpath:')
+        _log.debug ('')
+        _log.debug ('write data to outpath:')
 
-        self.msg = self.save_data (self.outpath)
+        self.msg = self.save_data (self.outpath, columns=self.columns, \
+            tmpdir=self.tmpdir, keep_raw=self.keep_raw)
+        self.status = 'ok'
             
-        if debug:
-            logging.debug ('')
-            logging.debug (f'returned save_data: msg= {self.msg:s}')
+        _log.debug ('')
+        _log.debug ('returned save_data: msg= %s', self.msg)
 
         return (self.msg)
 
@@ -3005,16 +2984,14 @@ class NeidTap(object):
     def send_sync (self, query, **kwargs):
 
        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter send_sync:')
-            logging.debug (f'query= {query:s}')
+        _log.debug ('')
+        _log.debug ('Enter send_sync:')
+        _log.debug ('query= %s', query)
  
-        url = self.url + '/sync'
+        url = urllib.parse.urljoin (self.url.rstrip('/') + '/', 'sync')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'url= {url:s}')
+        _log.debug ('')
+        _log.debug ('url= %s', url)
 
         self.sync_job = 1
         self.async_job = 0
@@ -3028,51 +3005,62 @@ class NeidTap(object):
         if ('format' in kwargs):
             
             self.format = kwargs.get('format')
-            self.datadict['format'] = self.format              
+            self.datadict['format'] = str (self.format)
 
         
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'format= {self.format:s}')
+            _log.debug ('')
+            _log.debug ('format= %s', self.format)
             
         if ('maxrec' in kwargs):
             
-            self.maxrec = kwargs.get('maxrec')
+            self.maxrec = str (kwargs.get('maxrec'))
             self.datadict['maxrec'] = self.maxrec              
             
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'maxrec= {self.maxrec:s}')
+            _log.debug ('')
+            _log.debug ('maxrec= %s', self.maxrec)
         
         self.outpath = ''
         if ('outpath' in kwargs):
             self.outpath = kwargs.get('outpath')
+
+        self.columns = None
+        if ('columns' in kwargs):
+            self.columns = kwargs.get('columns')
+
+        self.tmpdir = None
+        if ('tmpdir' in kwargs):
+            self.tmpdir = kwargs.get('tmpdir')
+
+        self.keep_raw = False
+        if ('keep_raw' in kwargs):
+            self.keep_raw = kwargs.get('keep_raw')
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'outpath= {self.outpath:s}')
+        _log.debug ('')
+        _log.debug ('outpath= %s', self.outpath)
+        
+        data = self._static_data + list (self.datadict.items())
 	
         try:
             if (len(self.cookiepath) > 0):
         
-                self.response = requests.post (url, data= self.datadict, \
-                    cookies=self.cookiejar, allow_redirects=False, stream=True)
+                self.response = self._session.post (url, \
+                    data= data, cookies=self.cookiejar, \
+                    allow_redirects=False, stream=True)
             else: 
-                self.response = requesrs.post (url, data= self.datadict, \
-                    allow_redicts=False, stream=True)
+                self.response = self._session.post (url, \
+                    data= data, \
+                    allow_redirects=False, stream=True)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('request sent')
+            _log.debug ('')
+            _log.debug ('request sent')
 
         except Exception as e:
            
             self.status = 'error'
             self.msg = 'Error: ' + str(e)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'exception: e= {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: e= %s', e)
             
             return (self.msg)
 
@@ -3082,12 +3070,11 @@ class NeidTap(object):
                 self.resulturl = self.response.headers['Location']
         """
 
-        self.content_type = self.response.headers['Content-type']
+        self.content_type = _content_type (self.response)
         self.encoding = self.response.encoding
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'content_type= {self.content_type:s}')
+        _log.debug ('')
+        _log.debug ('content_type= %s', self.content_type)
        
         data = None
         self.status = ''
@@ -3097,34 +3084,30 @@ class NeidTap(object):
             """error message
             """
             try:
-                data = self.response.json()
+                data = _loads (self.response.content)
             except Exception:
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('JSON object parse error')
+                _log.debug ('')
+                _log.debug ('JSON object parse error')
       
                 self.status = 'error'
                 self.msg = 'Error: returned JSON object parse error'
                 
                 return (self.msg)
             
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'status= {self.status:s}')
-                logging.debug (f'msg= {self.msg:s}')
+            _log.debug ('')
+            _log.debug ('status= %s', self.status)
+            _log.debug ('msg= %s', self.msg)
      
-        """save table to file
+        """save table to file: the sync response body is the result itself
         """
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('got here')
+        self.response_result = self.response
 
-        self.msg = self.save_data (self.outpath)
+        self.msg = self.save_data (self.outpath, columns=self.columns, \
+            tmpdir=self.tmpdir, keep_raw=self.keep_raw)
             
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'returned save_data: msg= {self.msg:s}')
+        _log.debug ('')
+        _log.debug ('returned save_data: msg= %s', self.msg)
 
         return (self.msg)
 
@@ -3134,87 +3117,111 @@ class NeidTap(object):
     
     """{ NeidTap.save_data: save data to astropy table
     """
-    def save_data (self, outpath):
+    def save_data (self, outpath, columns=None, tmpdir=None, \
+        keep_raw=False):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter save_data:')
-            logging.debug (f'outpath= {outpath:s}')
-            logging.debug (f'format= {self.format:s}')
-      
-      
-        tmpfile_created = 0
+        _log.debug ('')
+        _log.debug ('Enter save_data:')
+        _log.debug ('outpath= %s', outpath)
+        _log.debug ('format= %s', self.format)
+
+        if (self._raw_result is not None):
+            self._raw_result.close()
+            self._raw_result = None
+
+        """stream the result from the socket: straight to outpath when 
+        given, else a votable straight into the votable parser, and the
+        ascii formats into a spooled buffer read by Table.read
+        """
+
+        self.response_result.raw.decode_content = True
 
-        fpath = ''
         if (len(outpath) >  0):
-            fpath = outpath
-        else:
-            fd, fpath = tempfile.mkstemp(suffix='.xml', dir='./')
-            tmpfile_created = 1 
-            
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'tmpfile_created = {tmpfile_created:d}')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'fpath= {fpath:s}')
-     
-        fp = open (fpath, "wb")
-            
-        for data in self.response_result.iter_content(4096):
+            try:
+                with open (outpath, 'wb') as fp:
+                    shutil.copyfileobj (self.response_result.raw, fp, \
+                        length=1024*1024)
+            finally:
+                self.response_result.close()
+
+            _log.debug ('')
+            _log.debug ('data written to file: %s', outpath)
                 
-            len_data = len(data)            
+            self.msg = 'Result downloaded to file [' + outpath + ']'
         
-            if (len_data < 1):
-                break
+        elif (self.format == 'votable'):
 
-            fp.write (data)
-        
-        fp.close()
+            """the astropy votable parser pulls the xml through the read 
+            method of the socket stream as it parses: the result bytes are
+            never buffered.  With columns, the parser skips the fields not 
+            listed.
+            """
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'data written to file: {fpath:s}')
-                
-        if (len(self.outpath) >  0):
+            try:
+                table = votable.parse (self.response_result.raw.read, \
+                    columns=columns).get_first_table()
+            finally:
+                self.response_result.close()
+
+            self.astropytbl = table.to_table()
             
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'xxx1')
-                
-            self.msg = 'Result downloaded to file [' + self.outpath + ']'
+            _log.debug ('')
+            _log.debug ('votable parsed from the response stream')
+            
+            self.msg = 'Result saved in memory (astropy table).'
+        
         else:
-    
-            """read temp outpath to astropy table
+
+            format = _ASCII_FORMATS.get (self.format)
+
+            if (format is None):
+                self.response_result.close()
+
+                self.msg = 'Error: unsupported result format: ' + \
+                    str (self.format)
+                raise Exception (self.msg)
+
+            """the ascii formats are spooled: results up to 64 MiB stay in 
+            memory, larger ones spill to a temporary file in tmpdir, or 
+            the system temporary directory rather than the working one
             """
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'xxx2')
-               
-            if (self.format == 'ipac'):
-                format = 'ascii.ipac'
-            elif (self.format == 'votable'):
-                format = 'votable'
-            elif (self.format == 'csv'):
-                format = 'ascii.csv'
-            elif (self.format == 'tsv'):
-                format = 'ascii.tab'
-
-            self.astropytbl = Table.read (fpath, format=format)	    
+            buf = tempfile.SpooledTemporaryFile (max_size=64*1024*1024, \
+                suffix='.tbl', dir=tmpdir)
+            
+            try:
+                shutil.copyfileobj (self.response_result.raw, buf, \
+                    length=1024*1024)
+            finally:
+                self.response_result.close()
+
+            _log.debug ('')
+            _log.debug ('data spooled: %d bytes', buf.tell())
+            
+            buf.seek (0)
+
+            """the ascii reader is given the spool's underlying binary 
+            file, a BytesIO or, after rollover, the temporary file: the 
+            SpooledTemporaryFile wrapper itself lacks the file methods the 
+            text reader astropy puts around it needs before python 3.11
+            """
+
+            try:
+                self.astropytbl = Table.read (buf._file, format=format)
+            except Exception:
+                buf.close()
+                raise
+
+            if keep_raw:
+                self._raw_result = buf
+            else:
+                buf.close()
+            
             self.msg = 'Result saved in memory (astropy table).'
       
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'{self.msg:s}')
-     
-        if (tmpfile_created == 1):
-            os.remove (fpath)
-            
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('tmpfile {fpath:s} deleted')
+        _log.debug ('')
+        _log.debug (self.msg)
 
         return (self.msg)
     
@@ -3226,9 +3233,8 @@ class NeidTap(object):
     """
     def print_data (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter print_data:')
+        _log.debug ('')
+        _log.debug ('Enter print_data:')
 
         try:
 
@@ -3259,47 +3265,96 @@ class NeidTap(object):
 
     """{ NeidTap.get_data
     """
-    def get_data (self, resultpath):
+    def __poll_delays (self, kwargs):
+
+        """first and longest wait between job polls: poll_interval and 
+        max_poll_interval kwargs override the 0.25 and 10 second defaults
+        """
+
+        delay = 0.25
+        if ('poll_interval' in kwargs):
+            delay = float (kwargs.get('poll_interval'))
+
+        maxdelay = 10.0
+        if ('max_poll_interval' in kwargs):
+            maxdelay = float (kwargs.get('max_poll_interval'))
+
+        return (delay, maxdelay)
+
+    def __wait_for_job (self, phase, **kwargs):
+
+        """poll the job phase with a growing interval until it is completed
+        or error: short jobs are picked up quickly and long ones are not 
+        polled every few seconds.
+        """
+
+        delay, maxdelay = self.__poll_delays (kwargs)
+
+        while ((phase.lower() != 'completed') and \
+            (phase.lower() != 'error')):
+                
+            time.sleep (delay)
+            phase = self.tapjob.get_phase()
+        
+            delay = min (delay*1.5, maxdelay)
+
+            _log.debug ('')
+            _log.debug ('phase= %s delay= %f', phase, delay)
+
+        return (phase)
+
+    def get_data (self, resultpath, **kwargs):
     
         """ loop until job is complete, then download the data to the 
-        given resultpath
+        given resultpath; poll_interval and max_poll_interval are passed 
+        on to the job polling as in send_async
         """
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_data:')
-            logging.debug (f'async_job = {self.async_job:d}')
-            logging.debug (f'resultpath = {resultpath:s}')
+        _log.debug ('')
+        _log.debug ('Enter get_data:')
+        _log.debug ('async_job = %d', self.async_job)
+        _log.debug ('resultpath = %s', resultpath)
 
 
 
         if (self.async_job == 0):
     
-            """sync data is in astropytbl
+            """sync data is in astropytbl; an ascii result saved with 
+            keep_raw still has its returned bytes spooled: they are copied 
+            as is, then released.
             """
-            self.astropytbl.write (resultpath)
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('astropytbl written to resultpath')
+            if (self._raw_result is not None):
+                
+                self._raw_result.seek (0)
+                
+                try:
+                    with open (resultpath, 'wb') as fp:
+                        shutil.copyfileobj (self._raw_result, fp, \
+                            length=1024*1024)
+                finally:
+                    self._raw_result.close()
+                    self._raw_result = None
+                
+                _log.debug ('')
+                _log.debug ('spooled result copied to resultpath')
+            
+            else:
+                self.astropytbl.write (resultpath, \
+                    format=_ASCII_FORMATS.get (self.format, self.format), \
+                    overwrite=True)
+
+                _log.debug ('')
+                _log.debug ('astropytbl written to resultpath')
 
             self.msg = 'Result written to file: [' + resultpath + ']'
         
         else:
             phase = self.tapjob.get_phase()
         
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'returned tapjob.get_phase: phase= {phase:s}')
+            _log.debug ('')
+            _log.debug ('returned tapjob.get_phase: phase= %s', phase)
 
-            while ((phase.lower() != 'completed') and \
-	        (phase.lower() != 'error')):
-                time.sleep (2)
-                phase = self.tapjob.get_phase()
-        
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (\
-                        f'returned tapjob.get_phase: phase= {phase:s}')
+            phase = self.__wait_for_job (phase, **kwargs)
 
             """ phase == 'error'
             """
@@ -3308,9 +3363,8 @@ class NeidTap(object):
                 self.status = 'error'
                 self.msg = self.tapjob.errorsummary
         
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'returned get_errorsummary: {self.msg:s}')
+                _log.debug ('')
+                _log.debug ('returned get_errorsummary: %s', self.msg)
             
                 return (self.msg)
 
@@ -3319,34 +3373,73 @@ class NeidTap(object):
             try:
                 self.tapjob.get_result (resultpath)
 
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'returned tapjob.get_result')
+                _log.debug ('')
+                _log.debug ('returned tapjob.get_result')
         
             except Exception as e:
             
                 self.status = 'error'
                 self.msg = 'Error: ' + str(e)
 	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
+                _log.debug ('')
+                _log.debug ('exception: e= %s', e)
             
                 return (self.msg)    
         
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('got here: download result successful')
+            _log.debug ('')
+            _log.debug ('result downloaded')
 
             self.status = 'ok'
             self.msg = 'Result downloaded to file: [' + resultpath + ']'
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'self.msg = {self.msg:s}')
+        _log.debug ('')
+        _log.debug ('self.msg = %s', self.msg)
        
         return (self.msg) 
     
+    async def get_data_async (self, resultpath, **kwargs):
+    
+        """asyncio version of get_data: the job is polled with asyncio.sleep
+        between polls and the blocking http calls run in the event loop's 
+        default executor, so the results of several jobs can be awaited 
+        together, e.g. with asyncio.gather.  Once the phase is final, 
+        get_data itself does the download.
+
+        The executor threads use this NeidTap's job, result and session: 
+        do not call its synchronous methods (or a second get_data_async 
+        on it) while the coroutine is pending.  Await jobs concurrently 
+        through separate NeidTap objects.
+        """
+        
+        _log.debug ('')
+        _log.debug ('Enter get_data_async:')
+
+        """asyncio.get_running_loop is only available from python 3.7 on
+        """
+
+        loop = getattr (asyncio, 'get_running_loop', \
+            asyncio.get_event_loop)()
+
+        if (self.async_job == 1):
+
+            phase = await loop.run_in_executor (None, self.tapjob.get_phase)
+        
+            delay, maxdelay = self.__poll_delays (kwargs)
+
+            while ((phase.lower() != 'completed') and \
+                (phase.lower() != 'error')):
+                
+                await asyncio.sleep (delay)
+                phase = await loop.run_in_executor (None, \
+                    self.tapjob.get_phase)
+        
+                delay = min (delay*1.5, maxdelay)
+
+                _log.debug ('')
+                _log.debug ('phase= %s delay= %f', phase, delay)
+
+        return (await loop.run_in_executor (None, self.get_data, resultpath))
+    
 class TapJob:
     """
     TapJob class is used internally by TapClient class to store a Tap job's 
@@ -3362,7 +3455,7 @@ class TapJob:
         self.msg = ''
         
         self.statusstruct = ''
-        self.job = ''
+        self._job = None
 
         self.jobid = ''
         self.processid = ''
@@ -3378,107 +3471,85 @@ class TapJob:
         self.parameters = ''
         self.resulturl = ''
 
+        """strong ETag of the last status document: a poll sends it back 
+        and a 304 reply keeps the phase already parsed.  Last-Modified is 
+        not used: with its one second resolution a phase change within the
+        second of the previous poll would be answered 304 for good.
+        """
+
+        self._etag = ''
+
+        """set once the phase is completed or error: the status document 
+        cannot change any more and the getters stop polling
+        """
+
+        self._terminal = False
+
+        """status polls and the result download reuse the http session 
+        of the NeidTap that submitted the job when given
+        """
+
+        self._session = None
+        if ('session' in kwargs):
+            self._session = kwargs.get('session')
+
+        if (self._session is None):
+            self._session = _get_session()
+
         if ('debug' in kwargs):
            
             self.debug = kwargs.get('debug')
            
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter Tapjob (debug on)')
+        _log.debug ('')
+        _log.debug ('Enter Tapjob (debug on)')
                                 
-        try:
-            self.__get_statusjob()
-         
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('returned __get_statusjob')
-
-        except Exception as e:
-           
-            self.status = 'error'
-            self.msg = 'Error: ' + str(e)
-	    
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'exception: e= {str(e):s}')
-            
-            raise Exception (self.msg)    
+        self.__refresh ()
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('done TapJob.init:')
+        _log.debug ('')
+        _log.debug ('done TapJob.init:')
 
         return     
     
-    def get_status (self):
-        
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_status')
-            logging.debug (f'phase= {self.phase:s}')
+    @property
+    def job (self):
 
-        if (self.phase.lower() != 'completed'):
+        """the status document as an xmltodict dictionary, built only when
+        a caller asks for it: polling reads the phase with lxml
+        """
 
-            try:
-                self.__get_statusjob ()
+        if (self._job is None):
+            self._job = xmltodict.parse (self.statusstruct)['uws:job']
 
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('returned get_statusjob:')
-                    logging.debug ('job= ')
-                    logging.debug (self.job)
+        return (self._job)
 
-            except Exception as e:
-           
-                self.status = 'error'
-                self.msg = 'Error: ' + str(e)
-	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
-                 
-                raise Exception (self.msg)   
+    def get_status (self):
+        
+        _log.debug ('')
+        _log.debug ('Enter get_status')
+        _log.debug ('phase= %s', self.phase)
+
+        if (not self._terminal):
+            self.__refresh ()
 
         return (self.statusstruct)
     
     def get_resulturl (self):
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_resulturl')
-            logging.debug (f'phase= {self.phase:s}')
+        _log.debug ('')
+        _log.debug ('Enter get_resulturl')
+        _log.debug ('phase= %s', self.phase)
 
-        if (self.phase.lower() != 'completed'):
-
-            try:
-                self.__get_statusjob ()
-
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('returned get_statusjob:')
-                    logging.debug ('job= ')
-                    logging.debug (self.job)
-
-            except Exception as e:
-           
-                self.status = 'error'
-                self.msg = 'Error: ' + str(e)
-	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
-                 
-                raise Exception (self.msg)   
+        if (not self._terminal):
+            self.__refresh ()
 
         return (self.resulturl)
     
     def get_result (self, outpath):
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_result')
-            logging.debug (f'resulturl= {self.resulturl:s}')
-            logging.debug (f'outpath= {outpath:s}')
+        _log.debug ('')
+        _log.debug ('Enter get_result')
+        _log.debug ('resulturl= %s', self.resulturl)
+        _log.debug ('outpath= %s', outpath)
 
         if (len(outpath) == 0):
             self.status = 'error'
@@ -3486,26 +3557,8 @@ class TapJob:
             return
 
         
-        if (self.phase.lower() != 'completed'):
-
-            try:
-                self.__get_statusjob ()
-
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('returned __get_statusjob')
-                    logging.debug (f'resulturl= {self.resulturl:s}')
-
-            except Exception as e:
-           
-                self.status = 'error'
-                self.msg = 'Error: ' + str(e)
-	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
-                
-                raise Exception (self.msg)    
+        if (not self._terminal):
+            self.__refresh ()
     
 
         if (len(self.resulturl) == 0):
@@ -3515,97 +3568,70 @@ class TapJob:
             raise Exception (self.msg)    
 	    
         try:
-            response = requests.get (self.resulturl, stream=True)
+            response = self._session.get (self.resulturl, stream=True)
         
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('resulturl request sent')
+            _log.debug ('')
+            _log.debug ('resulturl request sent')
 
         except Exception as e:
            
             self.status = 'error'
             self.msg = 'Error: ' + str(e)
 	    
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'exception: e= {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: e= %s', e)
             
             raise Exception (self.msg)    
      
-        """retrieve table from response
+        """retrieve table from response: copyfileobj pumps response.raw 
+        into the file through one reused buffer
         """
-        with open (outpath, "wb") as fp:
-            
-            for data in response.iter_content(4096):
-                
-                len_data = len(data)            
 
-                """comment block
-                if debug:
-                    logging.debug ('')
-                    logging.debug (f'len_data= {len_data:d}')
-                """
-
-                if (len_data < 1):
-                    break
+        response.raw.decode_content = True
 
-                fp.write (data)
-        fp.close()
+        try:
+            with open (outpath, "wb") as fp:
+                shutil.copyfileobj (response.raw, fp, length=_DOWNLOAD_CHUNK)
+        finally:
+            response.close()
         
         self.resultpath = outpath
         self.status = 'ok'
         self.msg = 'returned table written to output file: ' + outpath
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('done writing result to file')
+        _log.debug ('')
+        _log.debug ('done writing result to file')
             
         return        
     
     def get_parameters (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_parameters')
-            logging.debug ('parameters:')
-            logging.debug (self.parameters)
+        """the job's uws:parameters element as an lxml Element (None if 
+        the status document has none).  Earlier versions returned a 
+        BeautifulSoup Tag: iterate the Element for the uws:parameter 
+        children, read their 'id' with .get ('id') and their value with 
+        .text, or use etree.tostring () for the markup.
+        """
+
+        _log.debug ('')
+        _log.debug ('Enter get_parameters')
+        _log.debug ('parameters:')
+        _log.debug (self.parameters)
 
         return (self.parameters)
     
 
     def get_phase (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_phase')
-            logging.debug (f'self.phase= {self.phase:s}')
-
-        if ((self.phase.lower() != 'completed') and \
-	    (self.phase.lower() != 'error')):
-
-            try:
-                self.__get_statusjob ()
-
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('returned get_statusjob:')
-                    logging.debug ('job= ')
-                    logging.debug (self.job)
+        _log.debug ('')
+        _log.debug ('Enter get_phase')
+        _log.debug ('self.phase= %s', self.phase)
 
-            except Exception as e:
-           
-                self.status = 'error'
-                self.msg = 'Error: ' + str(e)
-	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
-                 
-                raise Exception (self.msg)   
+        if (not self._terminal):
+            self.__refresh ()
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'phase= {self.phase:s}')
+            _log.debug ('')
+            _log.debug ('phase= %s', self.phase)
 
         return (self.phase)
     
@@ -3613,85 +3639,47 @@ class TapJob:
     
     def get_jobid (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_jobid')
-
-        if (len(self.jobid) == 0):
-            self.jobid = self.job['uws:jobId']
+        _log.debug ('')
+        _log.debug ('Enter get_jobid')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'jobid= {self.jobid:s}')
+        _log.debug ('')
+        _log.debug ('jobid= %s', self.jobid)
 
         return (self.jobid)
     
     
     def get_processid (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_processid')
+        _log.debug ('')
+        _log.debug ('Enter get_processid')
 
-        if (len(self.processid) == 0):
-            self.processid = self.job['uws:processId']
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'processid= {self.processid:s}')
+        _log.debug ('')
+        _log.debug ('processid= %s', self.processid)
 
         return (self.processid)
     
 
     def get_starttime (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_starttime')
-
-        if (len(self.starttime) == 0):
-            self.starttime = self.job['uws:startTime']
+        _log.debug ('')
+        _log.debug ('Enter get_starttime')
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'starttime= {self.starttime:s}')
+        _log.debug ('')
+        _log.debug ('starttime= %s', self.starttime)
 
         return (self.starttime)
     
 
     def get_endtime (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_endtime')
-
-        if (self.phase.lower() != 'completed'):
+        _log.debug ('')
+        _log.debug ('Enter get_endtime')
 
-            try:
-                self.__get_statusjob ()
+        if (not self._terminal):
+            self.__refresh ()
 
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('returned get_statusjob:')
-                    logging.debug ('job= ')
-                    logging.debug (self.job)
-
-            except Exception as e:
-           
-                self.status = 'error'
-                self.msg = 'Error: ' + str(e)
-	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
-                 
-                raise Exception (self.msg)   
-
-        self.endtime = self.job['uws:endTime']
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'endtime= {self.endtime:s}')
+        _log.debug ('')
+        _log.debug ('endtime= %s', self.endtime)
 
         return (self.endtime)
     
@@ -3699,114 +3687,46 @@ class TapJob:
 
     def get_executionduration (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_executionduration')
+        _log.debug ('')
+        _log.debug ('Enter get_executionduration')
 
         
-        if (self.phase.lower() != 'completed'):
-
-            try:
-                self.__get_statusjob ()
-
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('returned get_statusjob:')
-                    logging.debug ('job= ')
-                    logging.debug (self.job)
-
-            except Exception as e:
-           
-                self.status = 'error'
-                self.msg = 'Error: ' + str(e)
-	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
-                 
-                raise Exception (self.msg)   
+        if (not self._terminal):
+            self.__refresh ()
 
-        self.executionduration = self.job['uws:executionDuration']
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'executionduration= {self.executionduration:s}')
+        _log.debug ('')
+        _log.debug ('executionduration= %s', self.executionduration)
 
         return (self.executionduration)
 
 
     def get_destruction (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_destruction')
+        _log.debug ('')
+        _log.debug ('Enter get_destruction')
 
-        if (self.phase.lower() != 'completed'):
+        if (not self._terminal):
+            self.__refresh ()
 
-            try:
-                self.__get_statusjob ()
-
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('returned get_statusjob:')
-                    logging.debug ('job= ')
-                    logging.debug (self.job)
-
-            except Exception as e:
-           
-                self.status = 'error'
-                self.msg = 'Error: ' + str(e)
-	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
-                 
-                raise Exception (self.msg)   
-
-        self.destruction = self.job['uws:destruction']
-
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'destruction= {self.destruction:s}')
+        _log.debug ('')
+        _log.debug ('destruction= %s', self.destruction)
 
         return (self.destruction)
     
     def get_errorsummary (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter get_errorsummary')
+        _log.debug ('')
+        _log.debug ('Enter get_errorsummary')
 
-        if ((self.phase.lower() != 'error') and \
-	    (self.phase.lower() != 'completed')):
-        
-            try:
-                self.__get_statusjob ()
-
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug ('returned get_statusjob:')
-                    logging.debug ('job= ')
-                    logging.debug (self.job)
-
-            except Exception as e:
-           
-                self.status = 'error'
-                self.msg = 'Error: ' + str(e)
-	    
-                if self.debug:
-                    logging.debug ('')
-                    logging.debug (f'exception: e= {str(e):s}')
-                 
-                raise Exception (self.msg)   
+        if (not self._terminal):
+            self.__refresh ()
 	
         if ((self.phase.lower() != 'error') and \
 	    (self.phase.lower() != 'completed')):
         
             self.msg = 'The process is still running.'
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'msg= {self.msg:s}')
+            _log.debug ('')
+            _log.debug ('msg= %s', self.msg)
 
             return (self.msg)
 	
@@ -3814,128 +3734,156 @@ class TapJob:
             
             self.msg = 'Process completed without error message.'
             
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'msg= {self.msg:s}')
+            _log.debug ('')
+            _log.debug ('msg= %s', self.msg)
 
             return (self.msg)
         
         elif (self.phase.lower() == 'error'):
 
-            self.errorsummary = self.job['uws:errorSummary']['uws:message']
-
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'errorsummary= {self.errorsummary:s}')
+            _log.debug ('')
+            _log.debug ('errorsummary= %s', self.errorsummary)
 
             return (self.errorsummary)
     
+    def __refresh (self):
+
+        """fetch and parse the job status document; a failure is recorded 
+        in status and msg before it is raised
+        """
+
+        try:
+            self.__get_statusjob ()
+
+            _log.debug ('')
+            _log.debug ('returned __get_statusjob')
+
+        except Exception as e:
+           
+            self.status = 'error'
+            self.msg = 'Error: ' + str(e)
+	    
+            _log.debug ('')
+            _log.debug ('exception: e= %s', e)
+                 
+            raise Exception (self.msg)   
+
     def __get_statusjob (self):
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('Enter __get_statusjob')
-            logging.debug (f'statusurl= {self.statusurl:s}')
+        _log.debug ('')
+        _log.debug ('Enter __get_statusjob')
+        _log.debug ('statusurl= %s', self.statusurl)
+
+        headers = dict()
+        if (len(self._etag) > 0):
+            headers['If-None-Match'] = self._etag
 
         """ self.status doesn't exist, call get_status
         """
         try:
-            self.response = requests.get (self.statusurl, stream=True)
+            self.response = self._session.get (self.statusurl, \
+                headers=headers, stream=True)
             
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('statusurl request sent')
+            _log.debug ('')
+            _log.debug ('statusurl request sent')
 
         except Exception as e:
            
            
             self.msg = 'Error: ' + str(e)
 	    
-            if self.debug:
-                logging.debug ('')
-                logging.debug (f'exception: e= {str(e):s}')
+            _log.debug ('')
+            _log.debug ('exception: e= %s', e)
             
             raise Exception (self.msg)    
      
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('response returned')
-            logging.debug (f'status_code= {self.response.status_code:d}')
+        _log.debug ('')
+        _log.debug ('response returned')
+        _log.debug ('status_code= %d', self.response.status_code)
+
+        if (self.response.status_code == 304):
+
+            """status document unchanged since the last poll
+            """
+
+            self.response.close()
+            
+            _log.debug ('')
+            _log.debug ('not modified: phase= %s', self.phase)
+
+            return
+
+        self._etag = self.response.headers.get ('ETag', '')
+        if (self._etag.startswith ('W/')):
+            self._etag = ''
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('response.text= ')
-            logging.debug (self.response.text)
-        
         self.statusstruct = self.response.text
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('statusstruct= ')
-            logging.debug (self.statusstruct)
+        _log.debug ('')
+        _log.debug ('statusstruct= ')
+        _log.debug (self.statusstruct)
         
-        """ parse returned status xml structure for parameters
+        """pull the parameters, phase, result url and error message from 
+        one lxml parse; the dictionary form (self.job) is rebuilt lazily 
+        from statusstruct
         """
-        soup = bs.BeautifulSoup (self.statusstruct, 'lxml')
-            
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('soup initialized')
-        
-        self.parameters = soup.find('uws:parameters')
+
+        root = etree.fromstring (self.response.content)
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('self.parameters:')
-            logging.debug (self.parameters)
+        ns = {'uws': root.nsmap.get ('uws', _UWS_NS), 'xlink': _XLINK_NS}
         
+        self._job = None
+
+        self.parameters = root.find ('uws:parameters', namespaces=ns)
         
-        """convert status xml structure to dictionary doc 
+        _log.debug ('')
+        _log.debug ('self.parameters:')
+        _log.debug (self.parameters)
+
+        """all the job fields are read here, in one pass over the tree:
+        the getters only return them
         """
-        doc = xmltodict.parse (self.response.text)
-        self.job = doc['uws:job']
 
-        self.phase = self.job['uws:phase']
+        self.phase = root.findtext ('uws:phase', default='', namespaces=ns)
         
-        if self.debug:
-            logging.debug ('')
-            logging.debug (f'self.phase.lower():{ self.phase.lower():s}')
+        self.jobid = root.findtext ('uws:jobId', default='', namespaces=ns)
+        self.processid = root.findtext ('uws:processId', default='', \
+            namespaces=ns)
+        self.ownerid = root.findtext ('uws:ownerId', default='None', \
+            namespaces=ns)
+        self.quote = root.findtext ('uws:quote', default='None', \
+            namespaces=ns)
+        self.starttime = root.findtext ('uws:startTime', default='', \
+            namespaces=ns)
+        self.endtime = root.findtext ('uws:endTime', default='', \
+            namespaces=ns)
+        self.executionduration = root.findtext ('uws:executionDuration', \
+            default='', namespaces=ns)
+        self.destruction = root.findtext ('uws:destruction', default='', \
+            namespaces=ns)
+        self.errorsummary = root.findtext ('uws:errorSummary/uws:message', \
+            default='', namespaces=ns)
+        
+        _log.debug ('')
+        _log.debug ('self.phase: %s', self.phase)
         
        
         if (self.phase.lower() == 'completed'):
 
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('xxx1: got here')
-            
-            results = self.job['uws:results']
+            result = root.find ('uws:results/uws:result', namespaces=ns)
         
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('results')
-                logging.debug (results)
+            _log.debug ('')
+            _log.debug ('result')
+            _log.debug (result)
             
-            result = self.job['uws:results']['uws:result']
+            self.resulturl = result.get ('{%s}href' % _XLINK_NS)
         
-            if self.debug:
-                logging.debug ('')
-                logging.debug ('result')
-                logging.debug (result)
-            
-
-            self.resulturl = \
-                self.job['uws:results']['uws:result']['@xlink:href']
-        
-        elif (self.phase.lower() == 'error'):
-            self.errorsummary = self.job['uws:errorSummary']['uws:message']
 
+        self._terminal = (self.phase.lower() in ('completed', 'error'))
 
-        if self.debug:
-            logging.debug ('')
-            logging.debug ('self.job:')
-            logging.debug (self.job)
-            logging.debug (f'self.phase.lower(): {self.phase.lower():s}')
-            logging.debug (f'self.resulturl: {self.resulturl:s}')
+        _log.debug ('')
+        _log.debug ('self.phase: %s', self.phase)
+        _log.debug ('self.resulturl: %s', self.resulturl)
 
         return
     
@@ -2,9 +2,9 @@ from setuptools import setup, find_packages
 
 extensions = []
 
-reqs = []
-for line in open('requirements.txt', 'r').readlines():
-    reqs.append(line)
+with open ('requirements.txt', 'r') as fh:
+    reqs = [line.strip() for line in fh \
+        if line.strip() and not line.startswith('#')]
 
 with open ("README.md", "r") as fh:
     long_description = fh.read()
@@ -0,0 +1,18 @@
+def pytest_configure (config):
+
+    """markers used by test_queries.py: run 'pytest -m "not network"' 
+    for the offline tests only, or 'pytest -m "not slow"' to skip the 
+    FITS file downloads
+    """
+
+    config.addinivalue_line ("markers", \
+        "network: needs access to the NEID archive")
+    config.addinivalue_line ("markers", \
+        "slow: downloads FITS files from the NEID archive")
+
+    """registered by pytest-xdist as well: declared here so runs without 
+    the plugin do not warn about it
+    """
+
+    config.addinivalue_line ("markers", \
+        "xdist_group(name): run the tests of a group on one xdist worker")
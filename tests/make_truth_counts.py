@@ -0,0 +1,35 @@
+#
+#    rewrite truth_data/rowcounts.json with the number of records in 
+#    each truth IPAC table; run from the top level of the repo whenever
+#    a file in truth_data changes:
+#
+#        python tests/make_truth_counts.py
+#
+import os
+import json
+
+from astropy.io import ascii
+
+
+def main (truthdir='./truth_data'):
+
+    counts = dict()
+
+    for name in sorted (os.listdir (truthdir)):
+
+        if (not name.endswith ('.tbl')):
+            continue
+
+        tbl = ascii.read (os.path.join (truthdir, name), format='ipac', \
+            guess=False)
+        counts[name] = len(tbl)
+
+    with open (os.path.join (truthdir, 'rowcounts.json'), 'w') as fp:
+        json.dump (counts, fp, indent=4)
+        fp.write ('\n')
+
+    return
+
+
+if __name__ == '__main__':
+    main()
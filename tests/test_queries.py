@@ -1,17 +1,135 @@
 import os
-import sys
 import io
-import filecmp
+import json
+import mmap
 import pytest 
 from pathlib import Path
 
 from pyneid.neid import Neid 
-from astropy.table import Table,Column
+from pyneid.neid import core
+from astropy.io import ascii
 
 # These tests are designed to be run inside the 
 # Docker container built with the Dockerfile
 # at the top level of the repo.
 
+TRUTH = Path ('./truth_data')
+DNLOAD = Path ('./dnload_dir')
+
+#
+#    record counts of the truth tables, kept in truth_data/rowcounts.json
+#    by tests/make_truth_counts.py
+#
+with open (str (TRUTH / 'rowcounts.json')) as fp:
+    TRUTH_COUNTS = json.load (fp)
+
+#
+#    the result and truth files are all IPAC tables: read them as such
+#    without going through astropy's format guessing
+#
+def _read_ipac (path):
+    return (ascii.read (path, format='ipac', guess=False))
+
+
+#
+#    count the records of an IPAC table without parsing it: skip the 
+#    '\' keyword and '|' column header lines, then count the non-blank 
+#    lines of the data section, as the IPAC reader does
+#
+def _ipac_row_count (path):
+
+    nrow = 0
+
+    with open (path, 'rb') as fp:
+
+        for line in fp:
+            if (line[:1] not in (b'\\', b'|')) and (len(line.strip()) > 0):
+                nrow = 1
+                break
+
+        for line in fp:
+            if (len(line.strip()) > 0):
+                nrow = nrow + 1
+
+    return (nrow)
+
+
+#
+#    compare a result file with its truth file: files of different sizes
+#    are never read; otherwise both are memory-mapped and compared in 
+#    16 MiB slices
+#
+def _fast_file_eq (path, truthpath, blocksize=1 << 24):
+
+    size = os.stat (path).st_size
+
+    if (size != os.stat (truthpath).st_size):
+        return (False)
+
+    if (size == 0):
+        return (True)
+
+    with open (path, 'rb') as fp, open (truthpath, 'rb') as fp_truth, \
+        mmap.mmap (fp.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+        mmap.mmap (fp_truth.fileno(), 0, access=mmap.ACCESS_READ) as mm_truth:
+
+        return (all (mm[i:i+blocksize] == mm_truth[i:i+blocksize] \
+            for i in range (0, size, blocksize)))
+
+
+#
+#    one kept-alive http session for the whole test run, so the queries
+#    and downloads below reuse the same connections to the archive; it is
+#    made as the module's own, with its retries and cookie policy
+#
+@pytest.fixture (scope="session", autouse=True)
+
+def neid_session ():
+
+    session = core._make_session()
+
+    Neid.set_session (session)
+    yield (session)
+
+    session.close()
+
+
+#
+#    log in once per test session (once per worker under pytest-xdist);
+#    the queries below only read the cookie file, so they can run in 
+#    parallel.
+#
+@pytest.fixture (scope="session")
+
+def cookiepath (tmp_path_factory):
+
+    path = str (tmp_path_factory.getbasetemp() / 'neidtestcookie.txt')
+
+    Neid.login (cookiepath=path, \
+        userid='pyneidprop', \
+        password='pielemonquietyellow')
+
+    return (path)
+
+
+#
+#    the truth metadata tables read by test_download are parsed on 
+#    first use and shared by its cases
+#
+class TruthTables (dict):
+
+    def __missing__ (self, path):
+        tbl = _read_ipac (path)
+        self[path] = tbl
+        return (tbl)
+
+
+@pytest.fixture (scope="session")
+
+def truth_tables ():
+    return (TruthTables())
+
+
 # dummy user pyneidprop with limited access
 
 userdict = {
@@ -23,16 +141,17 @@ userdict = {
 #
 #    test login method: correctly, wrong userid, and wrong password
 #
+@pytest.mark.network
 @pytest.mark.parametrize ("user, expected", list(userdict.items()), \
     ids=list(userdict.keys()))  
  
-def test_login (user, expected, capsys):
+def test_login (user, expected, capsys, tmp_path):
    
     ind = user.index('_')
     userid = user[0:ind]
     password = user[ind+1:]
 
-    Neid.login (cookiepath='./neidtestcookie.txt', \
+    Neid.login (cookiepath=str (tmp_path / 'neidtestcookie.txt'), \
         userid=userid, \
         password=password)
 
@@ -51,17 +170,18 @@ datetimedict = {
     "l1":"2021-01-16 06:10:55/2021-01-16 23:59:59"
 }
 
+@pytest.mark.network
 @pytest.mark.parametrize ("datalevel,datetime", list(datetimedict.items()), \
     ids=list(datetimedict.keys()))
  
-def test_query_datetime (datalevel, datetime, capsys):
+def test_query_datetime (datalevel, datetime, cookiepath, tmp_path):
 
-    outpath = './datetime.' + datalevel + '.tbl'
-    datapath = './truth_data/datetime.' + datalevel + '.tbl'
+    outpath = str (tmp_path / f'datetime.{datalevel:s}.tbl')
+    datapath = str (TRUTH / f'datetime.{datalevel:s}.tbl')
 
     Neid.query_datetime (datalevel, \
         datetime, \
-        cookiepath='./neidtestcookie.txt', \
+        cookiepath=cookiepath, \
         format='ipac', \
         outpath=outpath)
 
@@ -69,20 +189,15 @@ def test_query_datetime (datalevel, datetime, capsys):
         f'Result not downloaded to file [{outpath:s}]'
     
     if (datalevel == 'l0'):
-        assert (filecmp.cmp (outpath, datapath, shallow=False))
+        assert (_fast_file_eq (outpath, datapath)), \
+            f"{outpath:s} differs from {datapath:s}"
 
     elif (datalevel == 'l1'):
-        astropytbl = None
-        astropytbl = Table.read (outpath, format='ascii.ipac')
-        assert (astropytbl is not None), \
-            "f{outpath:s} cannot be read by astropy"
+        nrow = _ipac_row_count (outpath)
 
-        astropytbl_truth = None
-        astropytbl_truth = Table.read (datapath, format='ascii.ipac')
-        assert (astropytbl_truth  is not None), \
-            "f{datapath:s} cannot be read by astropy"
+        nrow_truth = TRUTH_COUNTS[os.path.basename (datapath)]
 
-        assert (len(astropytbl) == len(astropytbl_truth)), \
+        assert (nrow == nrow_truth), \
             f"Number of records in {outpath:s} is incorrect"
 
 #
@@ -96,140 +211,87 @@ posdict = {
     "l1": "circle 23.634 68.95 1.0"
 }
 
+@pytest.mark.network
 @pytest.mark.parametrize ("datalevel,pos", list(posdict.items()), \
     ids=list(posdict.keys()))
  
-def test_query_position (datalevel, pos, capsys):
+def test_query_position (datalevel, pos, cookiepath, tmp_path):
 
-    outpath = './pos.' + datalevel + '.tbl'
-    datapath = './truth_data/pos.' + datalevel + '.tbl'
+    outpath = str (tmp_path / f'pos.{datalevel:s}.tbl')
+    datapath = str (TRUTH / f'pos.{datalevel:s}.tbl')
 
     Neid.query_position (datalevel, \
         pos, \
-        cookiepath='./neidtestcookie.txt', \
+        cookiepath=cookiepath, \
         format='ipac',
         outpath=outpath)
 
     assert os.path.exists(outpath), \
         f'Result not downloaded to file [{outpath:s}]'
-    #assert (filecmp.cmp (outpath, datapath, shallow=False))
-
-    astropytbl = None
-    astropytbl = Table.read (outpath, format='ascii.ipac')
-    assert (astropytbl is not None), \
-        "f{outpath:s} cannot be read by astropy"
-
-    astropytbl_truth = None
-    astropytbl_truth = Table.read (datapath, format='ascii.ipac')
-    assert (astropytbl_truth  is not None), \
-        "f{datapath:s} cannot be read by astropy"
-
-    assert (len(astropytbl) >= len(astropytbl_truth)), \
-        f"Number of records in {outpath:s} is incorrect"
-
-
-#
-#    test query_object method using l1 data
-#
-def test_query_object():
-
-    outpath = './object.l1.tbl'
-    datapath = './truth_data/object.l1.tbl'
-
-    Neid.query_object ('l1', \
-        'HD 9407', \
-        cookiepath='./neidtestcookie.txt', \
-        format='ipac', \
-        outpath=outpath)
-
-    assert os.path.exists(outpath), \
-        f'Result not downloaded to file [{outpath:s}]'
-    #assert (filecmp.cmp (outpath, datapath, shallow=False))
+    #assert (_fast_file_eq (outpath, datapath))
 
     astropytbl = None
-    astropytbl = Table.read (outpath, format='ascii.ipac')
+    astropytbl = _read_ipac (outpath)
     assert (astropytbl is not None), \
         "f{outpath:s} cannot be read by astropy"
 
-    astropytbl_truth = None
-    astropytbl_truth = Table.read (datapath, format='ascii.ipac')
-    assert (astropytbl_truth  is not None), \
-        "f{datapath:s} cannot be read by astropy"
+    nrow_truth = TRUTH_COUNTS[os.path.basename (datapath)]
 
-    assert (len(astropytbl) >= len(astropytbl_truth)), \
+    assert (len(astropytbl) >= nrow_truth), \
         f"Number of records in {outpath:s} is incorrect"
 
 
 #
-#    test query_qobject method using l1 data
+#    test query_object, query_qobject and query_program methods using 
+#    l1 data
 #
-def test_query_qobject():
-
-    outpath = './qobject.l1.tbl'
-    datapath = './truth_data/qobject.l1.tbl'
-
-    Neid.query_qobject ('l1', \
-        'Gaia DR2', \
-        cookiepath='./neidtestcookie.txt', \
-        format='ipac', \
-        outpath=outpath)
-
-    assert os.path.exists(outpath), \
-        f'Result not downloaded to file [{outpath:s}]'
-    #assert (filecmp.cmp (outpath, datapath, shallow=False))
-
-    astropytbl = None
-    astropytbl = Table.read (outpath, format='ascii.ipac')
-    assert (astropytbl is not None), \
-        "f{outpath:s} cannot be read by astropy"
+l1dict = {
+    "object":"HD 9407", \
+    "qobject":"Gaia DR2", \
+    "program":"2021A-2014"
+}
 
-    astropytbl_truth = None
-    astropytbl_truth = Table.read (datapath, format='ascii.ipac')
-    assert (astropytbl_truth  is not None), \
-        "f{datapath:s} cannot be read by astropy"
+@pytest.mark.network
+@pytest.mark.parametrize ("field,value", list(l1dict.items()), \
+    ids=list(l1dict.keys()))
 
-    assert (len(astropytbl) >= len(astropytbl_truth)), \
-        f"Number of records in {outpath:s} is incorrect"
+def test_query_field (field, value, cookiepath, tmp_path):
 
-#
-#    test query_program method using l1 data
-#
-def test_query_program():
+    outpath = str (tmp_path / f'{field:s}.l1.tbl')
+    datapath = str (TRUTH / f'{field:s}.l1.tbl')
 
-    outpath = './program.l1.tbl'
-    datapath = './truth_data/program.l1.tbl'
+    query = getattr (Neid, f'query_{field:s}')
 
-    Neid.query_program ('l1', \
-        '2021A-2014', \
-        cookiepath='./neidtestcookie.txt', \
+    query ('l1', \
+        value, \
+        cookiepath=cookiepath, \
         format='ipac', \
         outpath=outpath)
 
     assert os.path.exists(outpath), \
         f'Result not downloaded to file [{outpath:s}]'
-    #assert (filecmp.cmp (outpath, datapath, shallow=False))
+    #assert (_fast_file_eq (outpath, datapath))
 
     astropytbl = None
-    astropytbl = Table.read (outpath, format='ascii.ipac')
+    astropytbl = _read_ipac (outpath)
     assert (astropytbl is not None), \
         "f{outpath:s} cannot be read by astropy"
 
-    astropytbl_truth = None
-    astropytbl_truth = Table.read (datapath, format='ascii.ipac')
-    assert (astropytbl_truth  is not None), \
-        "f{datapath:s} cannot be read by astropy"
+    nrow_truth = TRUTH_COUNTS[os.path.basename (datapath)]
 
-    assert (len(astropytbl) >= len(astropytbl_truth)), \
+    assert (len(astropytbl) >= nrow_truth), \
         f"Number of records in {outpath:s} is incorrect"
 
 
 #
 #    test query_criteria method using l1 data
 #
-def test_query_criteria():
+@pytest.mark.network
+
+def test_query_criteria(cookiepath, tmp_path):
 
-    outpath = './criteria.l1.tbl'
-    datapath = './truth_data/criteria.l1.tbl'
+    outpath = str (tmp_path / 'criteria.l1.tbl')
+    datapath = str (TRUTH / 'criteria.l1.tbl')
 
     param = dict()
     param['datalevel'] = 'l1'
@@ -237,7 +299,7 @@ def test_query_criteria():
     param['object'] = 'HD 9407'
 
     Neid.query_criteria (param, \
-        cookiepath='./neidtestcookie.txt', \
+        cookiepath=cookiepath, \
         format='ipac', \
         outpath=outpath)
 
@@ -245,76 +307,76 @@ def test_query_criteria():
         f'Result not downloaded to file [{outpath:s}]'
     
     astropytbl = None
-    astropytbl = Table.read (outpath, format='ascii.ipac')
+    astropytbl = _read_ipac (outpath)
     assert (astropytbl is not None), \
         "f{outpath:s} cannot be read by astropy"
 
-    astropytbl_truth = None
-    astropytbl_truth = Table.read (datapath, format='ascii.ipac')
-    assert (astropytbl_truth  is not None), \
-        "f{datapath:s} cannot be read by astropy"
+    nrow_truth = TRUTH_COUNTS[os.path.basename (datapath)]
 
-    assert (len(astropytbl) >= len(astropytbl_truth)), \
+    assert (len(astropytbl) >= nrow_truth), \
         f"Number of records in {outpath:s} is incorrect"
 
 
 #
 #    test query_adql method using l1 data
 #
-def test_qeury_adql():
+@pytest.mark.network
 
-    outpath = './adql.l1.tbl'
-    datapath = './truth_data/adql.l1.tbl'
+def test_qeury_adql(cookiepath, tmp_path):
+
+    outpath = str (tmp_path / 'adql.l1.tbl')
+    datapath = str (TRUTH / 'adql.l1.tbl')
 
     query = "select l1filename, l1filepath, l1propint, qobject, object, qra, qdec, to_char(obsdate,'YYYY-MM-DD HH24:MI:SS.FF3') as date_obs, exptime, obsmode, obstype, program, piname, datalvl, seeing, airmass, moonagl, qrad as ra, qdecd as dec from neidl1 where ((obsdate >= to_date('2020-01-01 06:10:55', 'yyyy-mm-dd HH24:MI:SS') and obsdate <= to_date('2021-04-19 23:59:59', 'yyyy-mm-dd HH24:MI:SS')) and (qdecd >= -90.)) order by obsdate"
 
     Neid.query_adql (query, \
-        cookiepath='./neidtestcookie.txt', \
+        cookiepath=cookiepath, \
         format='ipac', \
         outpath=outpath)
 
     assert os.path.exists(outpath), \
         f'Result not downloaded to file [{outpath:s}]'
-    #assert (filecmp.cmp (outpath, datapath, shallow=False))
+    #assert (_fast_file_eq (outpath, datapath))
 
     astropytbl = None
-    astropytbl = Table.read (outpath, format='ascii.ipac')
+    astropytbl = _read_ipac (outpath)
     assert (astropytbl is not None), \
         "f{outpath:s} cannot be read by astropy"
 
-    astropytbl_truth = None
-    astropytbl_truth = Table.read (datapath, format='ascii.ipac')
-    assert (astropytbl_truth  is not None), \
-        "f{datapath:s} cannot be read by astropy"
+    nrow_truth = TRUTH_COUNTS[os.path.basename (datapath)]
 
-    assert (len(astropytbl) >= len(astropytbl_truth)), \
+    assert (len(astropytbl) >= nrow_truth), \
         f"Number of records in {outpath:s} is incorrect"
 
 #
-#    test query_adql method: 
-#    download the first two files from metadata file criteria.l1.tbl
+#    test download method: 
+#    download the first file listed in the truth metadata files, so the 
+#    test does not depend on the output of the query tests.  Both cases 
+#    share ./dnload_dir and are kept on one xdist worker.
 #
 dnloaddict = {
-    "l0":"./datetime.l0.tbl", \
-    "l1":"./criteria.l1.tbl"
+    "l0":str (TRUTH / 'datetime.l0.tbl'), \
+    "l1":str (TRUTH / 'criteria.l1.tbl')
 }
 
+@pytest.mark.slow
+@pytest.mark.network
+@pytest.mark.xdist_group ("serial")
 @pytest.mark.parametrize ("datalevel,metatbl", list(dnloaddict.items()), \
     ids=list(dnloaddict.keys()))
 
-def test_download(datalevel, metatbl, capsys):
+def test_download(datalevel, metatbl, cookiepath, truth_tables):
 #
 #    Check if metadata file contains datalevel + 'filepath' column
 #
-    astropytbl = Table.read (metatbl, format='ascii.ipac')
-    len_col = len(astropytbl.colnames)
+    astropytbl = truth_tables[metatbl]
+    
+    colnames = [colname.lower() for colname in astropytbl.colnames]
+    colname = f'{datalevel:s}filepath'
 
     ind_filepathcol = -1
-    for i in range (0, len_col):
-   
-        colname = datalevel + 'filepath'
-        if (astropytbl.colnames[i].lower() == colname):
-            ind_filepathcol = i
+    if (colname in colnames):
+        ind_filepathcol = colnames.index (colname)
 
     assert (ind_filepathcol >= 0), \
         "filepath column doesn't exit in metadata table"
@@ -322,22 +384,21 @@ def test_download(datalevel, metatbl, capsys):
 #
 #    Make sure ./dnload_dir is empty
 #
-    dnloaddir = './dnload_dir'
+    dnloaddir = str (DNLOAD)
     srow = 0
     erow = 1
 
     if (os.path.exists (dnloaddir)):
         
-        files = os.listdir(dnloaddir)
-        
-        for f in files: 
-            os.remove(dnloaddir + '/'+f)
+        with os.scandir (dnloaddir) as it:
+            for entry in it: 
+                os.unlink (entry.path)
 
     Neid.download(metatbl, \
         datalevel, \
         'ipac', \
         dnloaddir, \
-        cookiepath='./neidtestcookie.txt', \
+        cookiepath=cookiepath, \
         start_row=srow, \
         end_row=erow)
    
@@ -346,13 +407,73 @@ def test_download(datalevel, metatbl, capsys):
         filepath = astropytbl[i][ind_filepathcol]
         ind = filepath.rindex ('/')
         filename = filepath[ind+1:]
-        
-        print (f'filename= {filename:s}') 
-        print (f'filepath= {filepath:s}') 
     
-        dnloaded = dnloaddir + '/' + filename 
-        assert (os.path.exists (dnloaded))
+        dnloaded = str (DNLOAD / filename)
+        assert (os.path.exists (dnloaded)), \
+            f'{filepath:s} not downloaded to {dnloaded:s}'
         
         filesize = Path (dnloaded).stat().st_size
-        assert (filesize > 100000)
+        assert (filesize > 100000), \
+            f'{dnloaded:s} is too small: {filesize:d} bytes'
+
+
+
+#
+#    truth_data/rowcounts.json must agree with the truth tables: rerun 
+#    tests/make_truth_counts.py after changing them
+#
+def test_truth_counts ():
+
+    for name in os.listdir (str (TRUTH)):
+
+        if (name.endswith ('.tbl')):
+            assert (TRUTH_COUNTS.get (name) == \
+                _ipac_row_count (str (TRUTH / name))), \
+                f'rowcounts.json is out of date for {name:s}'
+
+
+#
+#    test NeidTap.send_sync without a cookie file: it runs offline 
+#    against a stand-in http session.
+#
+class FakeResponse:
+
+    def __init__ (self, body):
+        self.headers = {'Content-type': 'text/plain'}
+        self.encoding = None
+        self.raw = io.BytesIO (body)
+
+    def close (self):
+        self.raw.close()
+
+
+class FakeSession:
+
+    def __init__ (self, body):
+        self.body = body
+        self.calls = []
+
+    def post (self, url, **kwargs):
+        self.calls.append ((url, kwargs))
+        return (FakeResponse (self.body))
+
+
+def test_send_sync_nocookie (tmp_path):
+
+    from pyneid.neid.core import NeidTap
+
+    body = b'|a|\n|int|\n 1 \n'
+    session = FakeSession (body)
+    outpath = str (tmp_path / 'sync.tbl')
+
+    tap = NeidTap ('https://neid.example/TAP', session=session)
+    msg = tap.send_sync ('select a from t', format='ipac', outpath=outpath)
+
+    assert (msg == 'Result downloaded to file [' + outpath + ']')
+    assert (Path (outpath).read_bytes() == body)
 
+    url, kwargs = session.calls[0]
+    assert (url == 'https://neid.example/TAP/sync')
+    assert ('cookies' not in kwargs)
+    assert (kwargs['allow_redirects'] is False)
+    assert (dict (kwargs['data'])['query'] == 'select a from t')